@@ -5,6 +5,7 @@ It drives the existing demo-runner API and prints a concise run summary.
 """
 from __future__ import annotations
 
+import json
 import os
 import sys
 import time
@@ -12,6 +13,11 @@ from typing import Any
 
 import httpx
 
+_RULE = "=" * 68
+_THIN_RULE = "-" * 68
+_TERMINAL_STATUSES = {"complete", "error", "cancelled"}
+_TERMINAL_EVENTS = {"run.complete", "run.error"}
+
 
 def _runner_url() -> str:
     return os.environ.get("DEMO_RUNNER_URL", "http://127.0.0.1:4004").rstrip("/")
@@ -42,18 +48,34 @@ def _create_run(client: httpx.Client, base_url: str, mode: str, window_sec: int)
     return data["runId"]
 
 
+# run_id -> (etag, run) from the last full response, for conditional GETs. Only the run
+# being polled is kept, so a long-lived process does not accumulate finished runs.
+_run_cache: dict[str, tuple[str, dict[str, Any]]] = {}
+
+
 def _read_run(client: httpx.Client, base_url: str, run_id: str) -> dict[str, Any]:
-    response = client.get(f"{base_url}/runs/{run_id}")
+    cached = _run_cache.get(run_id)
+    headers = {"if-none-match": cached[0]} if cached else None
+    response = client.get(f"{base_url}/runs/{run_id}", headers=headers)
+    if response.status_code == 304 and cached:
+        return cached[1]
     response.raise_for_status()
-    return response.json()
+    run = json.loads(response.content)
+    etag = response.headers.get("etag")
+    if etag:
+        _run_cache.clear()
+        _run_cache[run_id] = (etag, run)
+    return run
 
 
-def _print_step_update(steps: list[dict[str, Any]], seen: set[str]) -> None:
+def _print_step_update(steps: list[dict[str, Any]], seen: dict[Any, tuple[Any, Any]]) -> None:
+    # `seen` maps stepId -> last printed (status, message); only changes are printed.
     for step in steps:
-        key = f"{step.get('stepId')}::{step.get('status')}::{step.get('message')}"
-        if key in seen:
+        sig = (step.get("status"), step.get("message"))
+        step_id = step.get("stepId")
+        if seen.get(step_id) == sig:
             continue
-        seen.add(key)
+        seen[step_id] = sig
         print(
             f"[step] {step.get('stepId', '-'):<24} "
             f"{step.get('status', '-'):<10} "
@@ -61,22 +83,64 @@ def _print_step_update(steps: list[dict[str, Any]], seen: set[str]) -> None:
         )
 
 
+def _follow_stream(
+    client: httpx.Client,
+    base_url: str,
+    run_id: str,
+    seen: dict[Any, tuple[Any, Any]],
+    deadline: float,
+) -> bool:
+    """Print step events pushed over the runner's SSE stream.
+
+    Returns True once a terminal run event arrives, False if the stream ended or
+    the deadline passed first.
+    """
+    with client.stream("GET", f"{base_url}/runs/{run_id}/stream") as response:
+        response.raise_for_status()
+        for line in response.iter_lines():
+            if time.time() > deadline:
+                return False
+            if not line.startswith("data:"):
+                continue
+            event = json.loads(line[5:])
+            if event.get("stepId"):
+                _print_step_update([event], seen)
+            if event.get("type") in _TERMINAL_EVENTS:
+                return True
+    return False
+
+
+def _print_final(run: dict[str, Any]) -> None:
+    status = run.get("status")
+    print(_THIN_RULE)
+    print(f"[run] final status: {status}")
+    if run.get("errors"):
+        print(f"[run] errors: {run['errors']}")
+    summary = run.get("artifacts", {}).get("summary", {})
+    print(f"[run] agreements: {summary.get('agreementIds', run.get('agreementIds', []))}")
+    print(f"[run] disputes: {summary.get('disputeIds', run.get('disputeIds', []))}")
+    print(_THIN_RULE)
+    if status != "complete":
+        sys.exit(1)
+
+
 def main() -> None:
     base_url = _runner_url()
     mode = _mode()
     window_sec = _window_sec()
-    poll_sec = float(os.environ.get("DEMO_POLL_SEC", "2"))
+    poll_cap_sec = float(os.environ.get("DEMO_POLL_SEC", "4"))
     timeout_sec = float(os.environ.get("DEMO_TIMEOUT_SEC", "600"))
 
-    print("=" * 68)
+    print(_RULE)
     print("VERDICT PROTOCOL AGENT DEMO")
     print(f"runner: {base_url}")
     print(f"mode: {mode}")
     print(f"window: {window_sec}s")
-    print("=" * 68)
+    print(_RULE)
 
     started = time.time()
-    seen_steps: set[str] = set()
+    deadline = started + timeout_sec
+    seen_steps: dict[Any, tuple[Any, Any]] = {}
 
     with httpx.Client(timeout=30) as client:
         health = client.get(f"{base_url}/health")
@@ -90,29 +154,28 @@ def main() -> None:
         run_id = _create_run(client, base_url, mode, window_sec)
         print(f"[run] created: {run_id}")
 
+        try:
+            _follow_stream(client, base_url, run_id, seen_steps, deadline)
+        except (httpx.HTTPError, json.JSONDecodeError) as exc:
+            print(f"[run] event stream unavailable ({exc}), falling back to polling")
+
+        # Polling only does real work if the stream dropped before the run finished;
+        # otherwise the first read already carries the terminal status.
+        delay = 0.25
         while True:
             run = _read_run(client, base_url, run_id)
             _print_step_update(run.get("steps", []), seen_steps)
 
-            status = run.get("status")
-            if status in {"complete", "error", "cancelled"}:
-                print("-" * 68)
-                print(f"[run] final status: {status}")
-                if run.get("errors"):
-                    print(f"[run] errors: {run['errors']}")
-                summary = run.get("artifacts", {}).get("summary", {})
-                print(f"[run] agreements: {summary.get('agreementIds', run.get('agreementIds', []))}")
-                print(f"[run] disputes: {summary.get('disputeIds', run.get('disputeIds', []))}")
-                print("-" * 68)
-                if status != "complete":
-                    sys.exit(1)
+            if run.get("status") in _TERMINAL_STATUSES:
+                _print_final(run)
                 return
 
-            if time.time() - started > timeout_sec:
+            if time.time() > deadline:
                 print(f"[run] timeout after {timeout_sec}s")
                 sys.exit(2)
 
-            time.sleep(poll_sec)
+            time.sleep(delay)
+            delay = min(delay * 2, poll_cap_sec)
 
 
 if __name__ == "__main__":
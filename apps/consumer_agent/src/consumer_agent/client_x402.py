@@ -1,23 +1,52 @@
 from __future__ import annotations
 
+import atexit
 import hashlib
 import os
+import threading
+from collections.abc import Mapping
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
 
-import httpx
 import requests
 from eth_account import Account
+from verdict_protocol import canonical_json_bytes
 from x402.client import x402ClientSync
 from x402.http.clients.requests import wrapRequestsWithPayment
 from x402.mechanisms.evm.exact.register import register_exact_evm_client
 from x402.mechanisms.evm.signers import EthAccountSigner
 
+# Payment-wrapped sessions are reused by every client for the same key and network.
+_SESSION_CACHE: dict[tuple[str, str], requests.Session] = {}
+_SESSION_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=32)
+def _account(private_key: str) -> Any:
+    return Account.from_key(private_key)
+
+
+# Plain session for X402_ALLOW_MOCK requests, so mock mode also reuses connections.
+_MOCK_SESSION = requests.Session()
+
+
+def _close_sessions() -> None:
+    with _SESSION_LOCK:
+        for session in _SESSION_CACHE.values():
+            session.close()
+        _SESSION_CACHE.clear()
+    _MOCK_SESSION.close()
+
+
+atexit.register(_close_sessions)
+
 
 @dataclass(slots=True)
 class X402Response:
     status_code: int
     payload: dict
-    headers: dict[str, str]
+    headers: Mapping[str, str]
     payment_reference: str
 
 
@@ -28,48 +57,51 @@ class X402Client:
         self._session = self._build_sdk_session()
 
     def _build_sdk_session(self) -> requests.Session | None:
-        try:
-            account = Account.from_key(self.consumer_private_key)
-            signer = EthAccountSigner(account)
+        key = (self.consumer_private_key, self.network)
+        with _SESSION_LOCK:
+            session = _SESSION_CACHE.get(key)
+            if session is not None:
+                return session
+            try:
+                signer = EthAccountSigner(_account(self.consumer_private_key))
 
-            xclient = x402ClientSync()
-            register_exact_evm_client(xclient, signer, networks=self.network)
+                xclient = x402ClientSync()
+                register_exact_evm_client(xclient, signer, networks=self.network)
 
-            return wrapRequestsWithPayment(requests.Session(), xclient)
-        except Exception:
-            return None
+                session = wrapRequestsWithPayment(requests.Session(), xclient)
+            except Exception:
+                return None
+            _SESSION_CACHE[key] = session
+            return session
 
     def get(self, url: str) -> X402Response:
         if self._session is not None:
             try:
                 resp = self._session.get(url, timeout=60)
                 data = resp.json() if resp.content else {}
-                headers = {k.lower(): v for k, v in resp.headers.items()}
             except Exception:
                 mock = os.environ.get("X402_ALLOW_MOCK", "0") == "1"
                 if not mock:
                     raise
-                with httpx.Client(timeout=60) as client:
-                    resp = client.get(url, headers={"x-mock-x402": "1"})
+                resp = _MOCK_SESSION.get(url, headers={"x-mock-x402": "1"}, timeout=60)
                 data = resp.json()
-                headers = {k.lower(): v for k, v in resp.headers.items()}
         else:
-            headers = {}
             mock = os.environ.get("X402_ALLOW_MOCK", "0") == "1"
             if not mock:
                 raise RuntimeError(
                     "x402 client initialization failed; set X402_ALLOW_MOCK=1 for local mock mode"
                 )
             req_headers = {"x-mock-x402": "1"} if mock else {}
-            with httpx.Client(timeout=60) as client:
-                resp = client.get(url, headers=req_headers)
+            resp = _MOCK_SESSION.get(url, headers=req_headers, timeout=60)
             data = resp.json()
-            headers = {k.lower(): v for k, v in resp.headers.items()}
+
+        # requests' CaseInsensitiveDict already matches keys in any case; hand it out
+        # as-is instead of copying every header into a lowercased dict.
+        headers = resp.headers
 
         payment_ref = headers.get("x402-payment-reference") or headers.get("x-payment-reference")
         if not payment_ref:
-            digest_input = f"{url}:{self.consumer_private_key[:10]}:{data}".encode()
-            payment_ref = "fallback-" + hashlib.sha256(digest_input).hexdigest()
+            payment_ref = self._fallback_reference(url, data)
 
         return X402Response(
             status_code=resp.status_code,
@@ -77,3 +109,14 @@ class X402Client:
             headers=headers,
             payment_reference=payment_ref,
         )
+
+    def _fallback_reference(self, url: str, data: dict) -> str:
+        """Derive a deterministic reference when the server does not return one.
+
+        Hashes the URL and the canonical JSON of the payload; no key material goes in.
+        """
+        digest = hashlib.sha256()
+        digest.update(url.encode())
+        digest.update(b":")
+        digest.update(canonical_json_bytes(data))
+        return "fallback-" + digest.hexdigest()
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass, field
+from functools import cache
+
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+
+def runtime_contract_address() -> str:
+    if os.environ.get("ESCROW_CONTRACT_MODE", "").lower() == "split":
+        return os.environ.get("ESCROW_COURT_ADDRESS", ZERO_ADDRESS)
+    return os.environ.get("ESCROW_CONTRACT_ADDRESS", ZERO_ADDRESS)
+
+
+@dataclass(frozen=True, slots=True)
+class FlowConfig:
+    evidence_url: str
+    provider_url: str
+    chain_id: int
+    contract_addr: str
+    x402_network: str
+    provider_key: str = field(repr=False)
+    consumer_key: str = field(repr=False)
+    judge_key: str = field(repr=False)
+
+
+@cache
+def load_flow_config() -> FlowConfig:
+    """Read the flow settings from the environment once per process.
+
+    Call `load_flow_config.cache_clear()` after changing the environment (e.g. in tests).
+    """
+    return FlowConfig(
+        evidence_url=os.environ.get("EVIDENCE_SERVICE_URL", "http://127.0.0.1:4001"),
+        provider_url=os.environ.get("PROVIDER_API_URL", "http://127.0.0.1:4000"),
+        chain_id=int(os.environ.get("GOAT_CHAIN_ID", "48816")),
+        contract_addr=runtime_contract_address(),
+        x402_network=os.environ.get("X402_NETWORK", "eip155:84532"),
+        provider_key=os.environ.get("PROVIDER_PRIVATE_KEY", ""),
+        consumer_key=os.environ.get("CONSUMER_PRIVATE_KEY", ""),
+        judge_key=os.environ.get("JUDGE_PRIVATE_KEY", ""),
+    )
@@ -1,20 +1,65 @@
 from __future__ import annotations
 
 import os
+import threading
+from collections import OrderedDict
 
+from eth_account import Account
 from verdict_protocol import EscrowClient
 
+# Other variables EscrowClient reads while constructing; they are part of the cache key
+# so a changed deployment mode or mock DB path builds a fresh client.
+_CLIENT_ENV = (
+    "ESCROW_CONTRACT_MODE",
+    "ESCROW_COURT_ADDRESS",
+    "ESCROW_VAULT_ADDRESS",
+    "ESCROW_JUDGE_REGISTRY_ADDRESS",
+    "ESCROW_REGISTRY_ADDRESS",
+    "ESCROW_EVIDENCE_ANCHOR_ADDRESS",
+    "ESCROW_MOCK_DB_PATH",
+)
+_CLIENT_CACHE_SIZE = 8
+
+# Clients are keyed by signer address; the private key itself lives only inside the
+# cached EscrowClient and is dropped with it on eviction. A shared client serialises its
+# own transactions, so flows running on several threads with one wallet cannot race on
+# nonces.
+_clients: OrderedDict[tuple[object, ...], EscrowClient] = OrderedDict()
+_clients_lock = threading.Lock()
+
 
 def build_client(private_key: str | None = None, *, dry_run: bool | None = None) -> EscrowClient:
     if dry_run is None:
         dry_run = os.environ.get("ESCROW_DRY_RUN", "0") == "1"
 
-    return EscrowClient(
-        rpc_url=os.environ.get("GOAT_RPC_URL", "https://rpc.testnet3.goat.network"),
-        chain_id=int(os.environ.get("GOAT_CHAIN_ID", "48816")),
-        contract_address=os.environ.get(
-            "ESCROW_CONTRACT_ADDRESS", "0x0000000000000000000000000000000000000000"
-        ),
-        private_key=private_key,
-        dry_run=dry_run,
+    rpc_url = os.environ.get("GOAT_RPC_URL", "https://rpc.testnet3.goat.network")
+    chain_id = int(os.environ.get("GOAT_CHAIN_ID", "48816"))
+    contract_address = os.environ.get(
+        "ESCROW_CONTRACT_ADDRESS", "0x0000000000000000000000000000000000000000"
     )
+    signer = Account.from_key(private_key).address if private_key else None
+    key = (
+        rpc_url,
+        chain_id,
+        contract_address,
+        signer,
+        bool(dry_run),
+        tuple(os.environ.get(name) for name in _CLIENT_ENV),
+    )
+
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is not None:
+            _clients.move_to_end(key)
+            return client
+        client = EscrowClient(
+            rpc_url=rpc_url,
+            chain_id=chain_id,
+            contract_address=contract_address,
+            private_key=private_key,
+            dry_run=bool(dry_run),
+        )
+        _clients[key] = client
+        if len(_clients) > _CLIENT_CACHE_SIZE:
+            _clients.popitem(last=False)
+        return client
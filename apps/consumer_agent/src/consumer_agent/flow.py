@@ -2,24 +2,19 @@ from __future__ import annotations
 
 import os
 import time
-import uuid
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from .client_x402 import X402Client
+from .config import FlowConfig, load_flow_config
 from .escrow_client import build_client
-from .receipt_client import ReceiptClient
+from .receipt_client import ReceiptClient, new_uuid4
 
 
 ProgressCallback = Callable[[dict[str, Any]], None]
 
 
-def _runtime_contract_address() -> str:
-    if os.environ.get("ESCROW_CONTRACT_MODE", "").lower() == "split":
-        return os.environ.get("ESCROW_COURT_ADDRESS", "0x0000000000000000000000000000000000000000")
-    return os.environ.get("ESCROW_CONTRACT_ADDRESS", "0x0000000000000000000000000000000000000000")
-
-
 def _emit(callback: ProgressCallback | None, event: dict[str, Any]) -> None:
     if callback is None:
         return
@@ -29,6 +24,9 @@ def _emit(callback: ProgressCallback | None, event: dict[str, Any]) -> None:
 def _step_start(
     emit: ProgressCallback | None, step_id: str, label: str, message: str = ""
 ) -> None:
+    # Unobserved flows (emit=None) skip building the event dict entirely.
+    if emit is None:
+        return
     _emit(
         emit,
         {
@@ -48,6 +46,8 @@ def _step_done(
     message: str = "",
     artifacts: dict[str, Any] | None = None,
 ) -> None:
+    if emit is None:
+        return
     payload: dict[str, Any] = {
         "type": "step.updated",
         "stepId": step_id,
@@ -60,6 +60,33 @@ def _step_done(
     _emit(emit, payload)
 
 
+def _deposit_and_bond(
+    *,
+    emit: ProgressCallback | None,
+    provider_actor,
+    consumer_actor,
+    provider_escrow,
+    consumer_escrow,
+    agreement_id: str,
+    amount: int,
+):
+    """Submit the provider pool deposit and the consumer bond.
+
+    They are signed by different wallets and don't depend on each other, so they run
+    concurrently; a shared wallet falls back to sequential sends to keep nonces ordered.
+    """
+    _step_start(
+        emit, "deposit_pool", "Provider deposits escrow pool", "Submitting deposit transaction"
+    )
+    _step_start(emit, "post_bond", "Consumer posts bond", "Submitting bond on GOAT")
+    if provider_actor.address == consumer_actor.address:
+        return provider_escrow.deposit_pool(amount), consumer_escrow.post_bond(agreement_id, amount)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        deposit_future = pool.submit(provider_escrow.deposit_pool, amount)
+        bond_future = pool.submit(consumer_escrow.post_bond, agreement_id, amount)
+        return deposit_future.result(), bond_future.result()
+
+
 def _maybe_open_split_contract(
     *,
     emit: ProgressCallback | None,
@@ -71,11 +98,11 @@ def _maybe_open_split_contract(
     provider_escrow,
     consumer_escrow,
     consideration: int,
+    judge_key: str,
 ) -> dict[str, Any] | None:
     if provider_escrow.deployment_mode != "split":
         return None
 
-    judge_key = os.environ.get("JUDGE_PRIVATE_KEY", "")
     if not judge_key:
         raise RuntimeError("JUDGE_PRIVATE_KEY is required in split contract mode")
     judge_actor = rc.actor_from_key(judge_key)
@@ -116,16 +143,41 @@ def _maybe_open_split_contract(
     }
 
 
-def run_happy_flow(*, emit: ProgressCallback | None = None, agreement_window_sec: int = 30) -> dict[str, Any]:
-    evidence_url = os.environ.get("EVIDENCE_SERVICE_URL", "http://127.0.0.1:4001")
-    provider_url = os.environ.get("PROVIDER_API_URL", "http://127.0.0.1:4000")
+def run_happy_flow(
+    *,
+    emit: ProgressCallback | None = None,
+    agreement_window_sec: int = 30,
+    skip_dispute_wait: bool | None = None,
+) -> dict[str, Any]:
+    """Run the happy path; `skip_dispute_wait` defaults to DEMO_SKIP_WAIT=1 in the env."""
+    if skip_dispute_wait is None:
+        skip_dispute_wait = os.environ.get("DEMO_SKIP_WAIT", "0") == "1"
+    cfg = load_flow_config()
+    with ReceiptClient(cfg.evidence_url) as rc:
+        return _run_happy_flow(
+            rc,
+            cfg,
+            emit=emit,
+            agreement_window_sec=agreement_window_sec,
+            skip_dispute_wait=skip_dispute_wait,
+        )
+
 
-    provider_key = os.environ.get("PROVIDER_PRIVATE_KEY", "")
-    consumer_key = os.environ.get("CONSUMER_PRIVATE_KEY", "")
+def _run_happy_flow(
+    rc: ReceiptClient,
+    cfg: FlowConfig,
+    *,
+    emit: ProgressCallback | None,
+    agreement_window_sec: int,
+    skip_dispute_wait: bool,
+) -> dict[str, Any]:
+    provider_url = cfg.provider_url
+
+    provider_key = cfg.provider_key
+    consumer_key = cfg.consumer_key
     if not provider_key or not consumer_key:
         raise RuntimeError("PROVIDER_PRIVATE_KEY and CONSUMER_PRIVATE_KEY are required")
 
-    rc = ReceiptClient(evidence_url)
     provider_actor = rc.actor_from_key(provider_key)
     consumer_actor = rc.actor_from_key(consumer_key)
 
@@ -136,9 +188,9 @@ def run_happy_flow(*, emit: ProgressCallback | None = None, agreement_window_sec
         "Loaded provider and consumer identities from env",
     )
 
-    agreement_id = str(uuid.uuid4())
-    chain_id = int(os.environ.get("GOAT_CHAIN_ID", "48816"))
-    contract_addr = _runtime_contract_address()
+    agreement_id = new_uuid4()
+    chain_id = cfg.chain_id
+    contract_addr = cfg.contract_addr
 
     _step_start(emit, "clause_created", "Create arbitration clause", "Preparing clause fields")
     clause = rc.create_clause(
@@ -161,8 +213,15 @@ def run_happy_flow(*, emit: ProgressCallback | None = None, agreement_window_sec
     consumer_escrow = build_client(consumer_key)
     escrow_amount = 10**15
 
-    _step_start(emit, "deposit_pool", "Provider deposits escrow pool", "Submitting deposit transaction")
-    deposit_tx = provider_escrow.deposit_pool(escrow_amount)
+    deposit_tx, bond_tx = _deposit_and_bond(
+        emit=emit,
+        provider_actor=provider_actor,
+        consumer_actor=consumer_actor,
+        provider_escrow=provider_escrow,
+        consumer_escrow=consumer_escrow,
+        agreement_id=agreement_id,
+        amount=escrow_amount,
+    )
     _step_done(
         emit,
         "deposit_pool",
@@ -170,9 +229,6 @@ def run_happy_flow(*, emit: ProgressCallback | None = None, agreement_window_sec
         "Pool deposit complete",
         {"txHash": deposit_tx.tx_hash, "contractAddress": contract_addr},
     )
-
-    _step_start(emit, "post_bond", "Consumer posts bond", "Submitting bond on GOAT")
-    bond_tx = consumer_escrow.post_bond(agreement_id, escrow_amount)
     _step_done(
         emit,
         "post_bond",
@@ -191,11 +247,12 @@ def run_happy_flow(*, emit: ProgressCallback | None = None, agreement_window_sec
         provider_escrow=provider_escrow,
         consumer_escrow=consumer_escrow,
         consideration=escrow_amount,
+        judge_key=cfg.judge_key,
     )
 
     _step_start(emit, "provider_call", "Provider API call", "Requesting /api/data with x402 payment")
     x402 = X402Client(consumer_key)
-    request_id = str(uuid.uuid4())
+    request_id = new_uuid4()
 
     req_payload = {"path": "/api/data", "requestId": request_id}
     req_receipt = rc.create_receipt(
@@ -211,12 +268,11 @@ def run_happy_flow(*, emit: ProgressCallback | None = None, agreement_window_sec
         payload=req_payload,
         prev_hash="0x0",
     )
-    rc.post_receipt(req_receipt)
     _step_done(
         emit,
         "provider_call",
         "Consumer request receipt",
-        "Request receipt recorded",
+        "Request receipt signed",
         {"receiptId": req_receipt["receiptId"], "actorId": req_receipt["actorId"]},
     )
 
@@ -239,12 +295,11 @@ def run_happy_flow(*, emit: ProgressCallback | None = None, agreement_window_sec
             "evidence_hash": response.headers.get("x-evidence-hash", ""),
         },
     )
-    rc.post_receipt(res_receipt)
     _step_done(
         emit,
         "provider_call",
         "Provider response receipt",
-        "Response receipt recorded",
+        "Response receipt signed",
         {"receiptId": res_receipt["receiptId"], "statusCode": response.status_code},
     )
 
@@ -259,11 +314,12 @@ def run_happy_flow(*, emit: ProgressCallback | None = None, agreement_window_sec
         counterparty=provider_actor,
         event_type="payment",
         request_id=request_id,
-        payload={"network": os.environ.get("X402_NETWORK", "eip155:84532")},
+        payload={"network": cfg.x402_network},
         prev_hash=res_receipt["receiptHash"],
         metadata={"x402_payment_reference": response.payment_reference},
     )
-    rc.post_receipt(payment_receipt)
+    # All three receipts are known now; ship them to the evidence service in one round-trip.
+    rc.post_receipts_bulk([req_receipt, res_receipt, payment_receipt])
     _step_done(
         emit,
         "payment_receipt",
@@ -297,6 +353,10 @@ def run_happy_flow(*, emit: ProgressCallback | None = None, agreement_window_sec
             "Split court contract settled",
             {"contractId": split_contract["contractId"], "txHash": completion_tx.tx_hash},
         )
+    elif skip_dispute_wait:
+        _step_done(
+            emit, "dispute_window_wait", "Wait dispute window", "Dispute window wait skipped"
+        )
     else:
         _step_start(emit, "dispute_window_wait", "Wait dispute window", f"Waiting {agreement_window_sec}s")
         time.sleep(agreement_window_sec)
@@ -324,15 +384,21 @@ def run_happy_flow(*, emit: ProgressCallback | None = None, agreement_window_sec
 def run_dispute_flow(
     *, emit: ProgressCallback | None = None, agreement_window_sec: int = 30
 ) -> dict[str, Any]:
-    evidence_url = os.environ.get("EVIDENCE_SERVICE_URL", "http://127.0.0.1:4001")
-    provider_url = os.environ.get("PROVIDER_API_URL", "http://127.0.0.1:4000")
+    cfg = load_flow_config()
+    with ReceiptClient(cfg.evidence_url) as rc:
+        return _run_dispute_flow(rc, cfg, emit=emit, agreement_window_sec=agreement_window_sec)
 
-    provider_key = os.environ.get("PROVIDER_PRIVATE_KEY", "")
-    consumer_key = os.environ.get("CONSUMER_PRIVATE_KEY", "")
+
+def _run_dispute_flow(
+    rc: ReceiptClient, cfg: FlowConfig, *, emit: ProgressCallback | None, agreement_window_sec: int
+) -> dict[str, Any]:
+    provider_url = cfg.provider_url
+
+    provider_key = cfg.provider_key
+    consumer_key = cfg.consumer_key
     if not provider_key or not consumer_key:
         raise RuntimeError("PROVIDER_PRIVATE_KEY and CONSUMER_PRIVATE_KEY are required")
 
-    rc = ReceiptClient(evidence_url)
     provider_actor = rc.actor_from_key(provider_key)
     consumer_actor = rc.actor_from_key(consumer_key)
 
@@ -343,9 +409,9 @@ def run_dispute_flow(
         "Loaded provider and consumer identities from env",
     )
 
-    agreement_id = str(uuid.uuid4())
-    chain_id = int(os.environ.get("GOAT_CHAIN_ID", "48816"))
-    contract_addr = _runtime_contract_address()
+    agreement_id = new_uuid4()
+    chain_id = cfg.chain_id
+    contract_addr = cfg.contract_addr
 
     _step_start(emit, "clause_created", "Create arbitration clause", "Preparing clause fields")
     clause = rc.create_clause(
@@ -368,8 +434,15 @@ def run_dispute_flow(
     consumer_escrow = build_client(consumer_key)
     escrow_amount = 10**15
 
-    _step_start(emit, "deposit_pool", "Provider deposits escrow pool", "Submitting deposit transaction")
-    deposit_tx = provider_escrow.deposit_pool(escrow_amount)
+    deposit_tx, bond_tx = _deposit_and_bond(
+        emit=emit,
+        provider_actor=provider_actor,
+        consumer_actor=consumer_actor,
+        provider_escrow=provider_escrow,
+        consumer_escrow=consumer_escrow,
+        agreement_id=agreement_id,
+        amount=escrow_amount,
+    )
     _step_done(
         emit,
         "deposit_pool",
@@ -377,9 +450,6 @@ def run_dispute_flow(
         "Pool deposit complete",
         {"txHash": deposit_tx.tx_hash},
     )
-
-    _step_start(emit, "post_bond", "Consumer posts bond", "Submitting bond on GOAT")
-    bond_tx = consumer_escrow.post_bond(agreement_id, escrow_amount)
     _step_done(
         emit,
         "post_bond",
@@ -398,10 +468,11 @@ def run_dispute_flow(
         provider_escrow=provider_escrow,
         consumer_escrow=consumer_escrow,
         consideration=escrow_amount,
+        judge_key=cfg.judge_key,
     )
 
     x402 = X402Client(consumer_key)
-    request_id = str(uuid.uuid4())
+    request_id = new_uuid4()
 
     _step_start(
         emit,
@@ -422,12 +493,11 @@ def run_dispute_flow(
         payload={"path": "/api/data?bad=true", "requestId": request_id},
         prev_hash="0x0",
     )
-    rc.post_receipt(req_receipt)
     _step_done(
         emit,
         "provider_call",
         "Consumer request receipt",
-        "Request recorded for bad path",
+        "Request receipt signed for bad path",
         {"receiptId": req_receipt["receiptId"]},
     )
 
@@ -451,7 +521,6 @@ def run_dispute_flow(
             "bad": True,
         },
     )
-    rc.post_receipt(res_receipt)
 
     sla_receipt = rc.create_receipt(
         chain_id=chain_id,
@@ -467,7 +536,7 @@ def run_dispute_flow(
         prev_hash=res_receipt["receiptHash"],
         metadata={"violation": "sla_breach:latency"},
     )
-    rc.post_receipt(sla_receipt)
+    rc.post_receipts_bulk([req_receipt, res_receipt, sla_receipt])
     _step_done(
         emit,
         "provider_call",
@@ -2,8 +2,8 @@ from __future__ import annotations
 
 import os
 import time
-import uuid
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 import httpx
@@ -16,25 +16,55 @@ from verdict_protocol import (
 )
 
 
-@dataclass(slots=True)
+def new_uuid4() -> str:
+    """Random RFC 4122 v4 id in the usual dashed form, without building a uuid.UUID."""
+    raw = bytearray(os.urandom(16))
+    raw[6] = (raw[6] & 0x0F) | 0x40
+    raw[8] = (raw[8] & 0x3F) | 0x80
+    h = raw.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+@dataclass(slots=True, frozen=True)
 class ActorIdentity:
     private_key: str
     address: str
     did: str
 
 
+@lru_cache(maxsize=32)
+def _actor_cached(private_key: str) -> ActorIdentity:
+    # Public-key derivation is the expensive part; flows re-derive the same keys every run.
+    account = Account.from_key(private_key)
+    return ActorIdentity(
+        private_key=private_key,
+        address=account.address,
+        did=f"did:8004:{account.address}",
+    )
+
+
 class ReceiptClient:
     def __init__(self, evidence_url: str) -> None:
         self.evidence_url = evidence_url.rstrip("/")
+        # One pooled client for every evidence-service call so the flow keeps a warm connection.
+        self._client = httpx.Client(
+            base_url=self.evidence_url,
+            timeout=30,
+            limits=httpx.Limits(max_keepalive_connections=8, max_connections=16),
+        )
+
+    def close(self) -> None:
+        self._client.close()
+
+    def __enter__(self) -> ReceiptClient:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     @staticmethod
     def actor_from_key(private_key: str) -> ActorIdentity:
-        account = Account.from_key(private_key)
-        return ActorIdentity(
-            private_key=private_key,
-            address=account.address,
-            did=f"did:8004:{account.address}",
-        )
+        return _actor_cached(private_key)
 
     def create_clause(
         self,
@@ -47,7 +77,7 @@ class ReceiptClient:
     ) -> dict[str, Any]:
         clause: dict[str, Any] = {
             "schemaVersion": "1.0.0",
-            "clauseId": str(uuid.uuid4()),
+            "clauseId": new_uuid4(),
             "chainId": chain_id,
             "contractAddress": contract_address,
             "agreementId": agreement_id,
@@ -100,14 +130,14 @@ class ReceiptClient:
         metadata = metadata or {}
         receipt: dict[str, Any] = {
             "schemaVersion": "1.0.0",
-            "receiptId": str(uuid.uuid4()),
+            "receiptId": new_uuid4(),
             "chainId": chain_id,
             "contractAddress": contract_address,
             "agreementId": agreement_id,
             "clauseHash": clause_hash,
             "sequence": sequence,
             "eventType": event_type,
-            "timestamp": int(time.time() * 1000),
+            "timestamp": time.time_ns() // 1_000_000,
             "actorId": actor.did,
             "counterpartyId": counterparty.did,
             "requestId": request_id,
@@ -122,22 +152,24 @@ class ReceiptClient:
         return receipt
 
     def post_clause(self, clause: dict[str, Any]) -> dict[str, Any]:
-        with httpx.Client(timeout=30) as client:
-            resp = client.post(f"{self.evidence_url}/clauses", json=clause)
-            resp.raise_for_status()
-            return resp.json()
+        resp = self._client.post("/clauses", json=clause)
+        resp.raise_for_status()
+        return resp.json()
 
     def post_receipt(self, receipt: dict[str, Any]) -> dict[str, Any]:
-        with httpx.Client(timeout=30) as client:
-            resp = client.post(f"{self.evidence_url}/receipts", json=receipt)
-            resp.raise_for_status()
-            return resp.json()
+        resp = self._client.post("/receipts", json=receipt)
+        resp.raise_for_status()
+        return resp.json()
+
+    def post_receipts_bulk(self, receipts: list[dict[str, Any]]) -> dict[str, Any]:
+        resp = self._client.post("/receipts:bulk", json={"receipts": receipts})
+        resp.raise_for_status()
+        return resp.json()
 
     def anchor(self, agreement_id: str) -> dict[str, Any]:
-        with httpx.Client(timeout=60) as client:
-            resp = client.post(f"{self.evidence_url}/anchor", json={"agreementId": agreement_id})
-            resp.raise_for_status()
-            return resp.json()
+        resp = self._client.post("/anchor", json={"agreementId": agreement_id}, timeout=60)
+        resp.raise_for_status()
+        return resp.json()
 
 
 def env_urls() -> tuple[str, str]:
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import uuid
 from unittest.mock import patch
 
-from consumer_agent.flow import _runtime_contract_address
+from consumer_agent.config import load_flow_config, runtime_contract_address
+from consumer_agent.receipt_client import new_uuid4
 
 
 def test_runtime_contract_address_uses_legacy_address_by_default() -> None:
@@ -13,7 +15,7 @@ def test_runtime_contract_address_uses_legacy_address_by_default() -> None:
         },
         clear=False,
     ):
-        assert _runtime_contract_address() == "0x" + "1" * 40
+        assert runtime_contract_address() == "0x" + "1" * 40
 
 
 def test_runtime_contract_address_uses_court_address_in_split_mode() -> None:
@@ -26,4 +28,26 @@ def test_runtime_contract_address_uses_court_address_in_split_mode() -> None:
         },
         clear=False,
     ):
-        assert _runtime_contract_address() == "0x" + "2" * 40
+        assert runtime_contract_address() == "0x" + "2" * 40
+
+
+def test_load_flow_config_reads_env_once_until_cleared() -> None:
+    load_flow_config.cache_clear()
+    try:
+        with patch.dict("os.environ", {"GOAT_CHAIN_ID": "1234"}, clear=False):
+            assert load_flow_config().chain_id == 1234
+        with patch.dict("os.environ", {"GOAT_CHAIN_ID": "5678"}, clear=False):
+            assert load_flow_config().chain_id == 1234
+            load_flow_config.cache_clear()
+            assert load_flow_config().chain_id == 5678
+    finally:
+        load_flow_config.cache_clear()
+
+
+def test_new_uuid4_is_a_valid_v4_uuid() -> None:
+    value = new_uuid4()
+    parsed = uuid.UUID(value)
+    assert parsed.version == 4
+    assert parsed.variant == uuid.RFC_4122
+    assert str(parsed) == value
+    assert new_uuid4() != value
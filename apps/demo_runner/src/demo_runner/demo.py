@@ -4,9 +4,13 @@ import json
 import os
 import subprocess
 import sys
+import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import cache
 from pathlib import Path
+from typing import IO
 
 import httpx
 
@@ -17,12 +21,14 @@ class ServiceProc:
     cmd: list[str]
     health_url: str
     proc: subprocess.Popen | None = None
+    log: IO[str] | None = None
 
 
 def _repo_root() -> Path:
     return Path(__file__).resolve().parents[4]
 
 
+@cache
 def _module_pythonpath() -> str:
     root = _repo_root()
     return os.pathsep.join(
@@ -37,54 +43,88 @@ def _module_pythonpath() -> str:
     )
 
 
-def _service_env() -> dict[str, str]:
-    env = os.environ.copy()
-    existing = env.get("PYTHONPATH", "")
+@cache
+def _extended_pythonpath(existing: str) -> str:
     extra_paths = [_module_pythonpath()]
     if existing:
         extra_paths.append(existing)
-    env["PYTHONPATH"] = os.pathsep.join(extra_paths)
+    return os.pathsep.join(extra_paths)
+
+
+def _service_env() -> dict[str, str]:
+    env = os.environ.copy()
+    env["PYTHONPATH"] = _extended_pythonpath(env.get("PYTHONPATH", ""))
     return env
 
 
+def _log_dir() -> Path:
+    return Path(os.environ.get("DEMO_LOG_DIR") or Path(tempfile.gettempdir()) / "verdict-demo")
+
+
+def _service_output(service: ServiceProc) -> IO[str] | int:
+    # Children no longer share the terminal: DEMO_QUIET=1 discards their output,
+    # otherwise each one gets its own line-buffered log file.
+    if os.environ.get("DEMO_QUIET") == "1":
+        return subprocess.DEVNULL
+    log_dir = _log_dir()
+    log_dir.mkdir(parents=True, exist_ok=True)
+    service.log = open(log_dir / f"{service.name}.log", "w", buffering=1)
+    return service.log
+
+
 def _wait_for_health(url: str, timeout: float = 45.0) -> None:
     start = time.time()
-    while time.time() - start < timeout:
-        try:
-            with httpx.Client(timeout=2) as client:
+    # Back off from 100ms to 1s so fast services are picked up almost immediately.
+    delay = 0.1
+    with httpx.Client(timeout=2) as client:
+        while time.time() - start < timeout:
+            try:
                 r = client.get(url)
                 if r.status_code < 500:
                     return
-        except Exception:
-            pass
-        time.sleep(1)
+            except Exception:
+                pass
+            time.sleep(delay)
+            delay = min(delay * 2, 1.0)
     raise TimeoutError(f"service did not become healthy: {url}")
 
 
 def _wait_for_verdict(
+    client: httpx.Client,
     agreement_id: str,
     *,
     base_url: str = "http://127.0.0.1:4002",
     timeout: float = 45.0,
 ) -> dict:
     start = time.time()
-    with httpx.Client(timeout=5) as client:
-        while time.time() - start < timeout:
-            try:
-                verdicts = client.get(f"{base_url}/verdicts").json()
-                items = verdicts.get("items", [])
-                if any(item.get("agreementId") == agreement_id for item in items):
-                    return verdicts
-            except Exception:
-                pass
-            time.sleep(1)
+    while time.time() - start < timeout:
+        try:
+            verdicts = json.loads(client.get(f"{base_url}/verdicts", timeout=5).content)
+            items = verdicts.get("items", [])
+            if any(item.get("agreementId") == agreement_id for item in items):
+                return verdicts
+        except Exception:
+            pass
+        time.sleep(1)
     raise TimeoutError(f"verdict did not appear for agreement: {agreement_id}")
 
 
-def _run_json_command(cmd: list[str]) -> dict:
-    result = subprocess.run(cmd, check=True, capture_output=True, text=True, env=_service_env())
-    stdout = result.stdout.strip()
-    return json.loads(stdout)
+def _run_json_command(cmd: list[str], extra_env: dict[str, str] | None = None) -> dict:
+    env = _service_env()
+    env.update(extra_env or {})
+    # json.loads takes the raw bytes and ignores surrounding whitespace, so skip decode/strip.
+    result = subprocess.run(cmd, check=True, capture_output=True, env=env)
+    return json.loads(result.stdout)
+
+
+def _run_flows_in_process() -> tuple[dict, dict]:
+    for path in reversed(_module_pythonpath().split(os.pathsep)):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+    from consumer_agent.flow import run_dispute_flow, run_happy_flow
+
+    # The CLI summary never looks at the happy-path dispute window, so don't sit through it.
+    return run_happy_flow(skip_dispute_wait=True), run_dispute_flow()
 
 
 def _explorer_link(tx_hash: str) -> str:
@@ -92,7 +132,37 @@ def _explorer_link(tx_hash: str) -> str:
     return f"{base}/tx/{tx_hash}"
 
 
+def _run_round(isolated: bool) -> dict:
+    if isolated:
+        happy = _run_json_command(
+            [sys.executable, "-m", "consumer_agent.run_happy_path"], {"DEMO_SKIP_WAIT": "1"}
+        )
+        dispute = _run_json_command([sys.executable, "-m", "consumer_agent.run_dispute_path"])
+    else:
+        happy, dispute = _run_flows_in_process()
+
+    # Reputation is updated from the verdict, so it is read after the verdict lands,
+    # but both go over the same pooled client.
+    with httpx.Client(timeout=10) as client:
+        verdicts = _wait_for_verdict(client, dispute["agreementId"])
+        reputations = json.loads(client.get("http://127.0.0.1:4003/reputation").content)
+
+    return {
+        "happy": happy,
+        "dispute": dispute,
+        "verdicts": verdicts,
+        "reputations": reputations,
+        "links": {
+            "happy_deposit": _explorer_link(happy["depositTx"]),
+            "dispute_tx": _explorer_link(dispute["disputeTx"]),
+        },
+    }
+
+
 def main() -> None:
+    # --isolated runs each consumer flow in its own interpreter (slower, but handy for debugging).
+    isolated = "--isolated" in sys.argv[1:]
+    keep_running = "--keep-running" in sys.argv[1:]
     services = [
         ServiceProc(
             name="evidence",
@@ -117,39 +187,42 @@ def main() -> None:
     ]
 
     procs: list[subprocess.Popen] = []
-    try:
-        for service in services:
-            service.proc = subprocess.Popen(
-                service.cmd,
-                stdout=sys.stdout,
-                stderr=sys.stderr,
-                env=_service_env(),
-            )
-            procs.append(service.proc)
 
-        for service in services:
-            _wait_for_health(service.health_url)
-
-        happy = _run_json_command([sys.executable, "-m", "consumer_agent.run_happy_path"])
-        dispute = _run_json_command([sys.executable, "-m", "consumer_agent.run_dispute_path"])
+    def spawn_and_wait(service: ServiceProc) -> None:
+        output = _service_output(service)
+        service.proc = subprocess.Popen(
+            service.cmd,
+            stdout=output,
+            stderr=subprocess.STDOUT,
+            env=_service_env(),
+        )
+        procs.append(service.proc)
+        _wait_for_health(service.health_url)
 
-        verdicts = _wait_for_verdict(dispute["agreementId"])
+    if os.environ.get("DEMO_QUIET") != "1":
+        print(f"service logs: {_log_dir()}", file=sys.stderr)
 
-        with httpx.Client(timeout=10) as client:
-            reputations = client.get("http://127.0.0.1:4003/reputation").json()
-
-        summary = {
-            "happy": happy,
-            "dispute": dispute,
-            "verdicts": verdicts,
-            "reputations": reputations,
-            "links": {
-                "happy_deposit": _explorer_link(happy["depositTx"]),
-                "dispute_tx": _explorer_link(dispute["disputeTx"]),
-            },
-        }
-
-        print(json.dumps(summary, indent=2))
+    try:
+        # Each service is spawned and health-checked in its own worker, so early services
+        # are probed while later ones are still being exec'd.
+        with ThreadPoolExecutor(max_workers=len(services)) as pool:
+            futures = [pool.submit(spawn_and_wait, service) for service in services]
+            for future in futures:
+                future.result()
+
+        print(json.dumps(_run_round(isolated), indent=2))
+
+        # --keep-running leaves the services up so an operator can run more rounds
+        # without paying the service cold start again.
+        while keep_running:
+            # Prompt on stderr so stdout stays a clean stream of summaries.
+            print("press Enter to run another round (Ctrl-D/Ctrl-C to stop)", file=sys.stderr)
+            try:
+                if not sys.stdin.readline():
+                    break
+            except KeyboardInterrupt:
+                break
+            print(json.dumps(_run_round(isolated), indent=2))
 
     finally:
         for proc in procs:
@@ -159,6 +232,9 @@ def main() -> None:
                 proc.wait(timeout=5)
             except subprocess.TimeoutExpired:
                 proc.kill()
+        for service in services:
+            if service.log is not None:
+                service.log.close()
 
 
 if __name__ == "__main__":
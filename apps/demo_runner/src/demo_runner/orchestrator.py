@@ -2,20 +2,36 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import functools
 import importlib
 import json
 import os
+import signal
 import subprocess
 import sys
+import threading
 import time
+from collections import deque
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit
+
+if TYPE_CHECKING:
+    import httpx
+
+
+_PATHS_INSTALLED = False
 
 
 def _ensure_pythonpath() -> None:
+    global _PATHS_INSTALLED
+    if _PATHS_INSTALLED:
+        return
     root = Path(__file__).resolve().parents[4]
+    existing = set(sys.path)
     for rel in [
         "apps/consumer_agent/src",
         "apps/evidence_service/src",
@@ -25,9 +41,11 @@ def _ensure_pythonpath() -> None:
         "apps/demo_runner/src",
         "packages/protocol/src",
     ]:
-        candidate = root / rel
-        if str(candidate) not in sys.path and candidate.exists():
-            sys.path.append(str(candidate))
+        candidate = str(root / rel)
+        if candidate not in existing and (root / rel).exists():
+            sys.path.append(candidate)
+            existing.add(candidate)
+    _PATHS_INSTALLED = True
 
 
 _ensure_pythonpath()
@@ -69,32 +87,39 @@ def _apply_runtime_defaults() -> None:
 
 _apply_runtime_defaults()
 
+# Chain settings are fixed once the runtime defaults are applied; resolve them once.
+_EXPLORER_URL = os.environ.get("GOAT_EXPLORER_URL", "https://explorer.testnet3.goat.network")
+_CONTRACT_ADDR = os.environ.get(
+    "ESCROW_CONTRACT_ADDRESS", "0xFBf9b5293A1737AC53880d3160a64B49bA54801D"
+)
+_CHAIN_ID = int(os.environ.get("GOAT_CHAIN_ID", "48816"))
+_CHAIN_RPC = os.environ.get("GOAT_RPC_URL", "https://rpc.testnet3.goat.network")
+
 
 def _repo_root() -> Path:
     return Path(__file__).resolve().parents[4]
 
 
-def _module_pythonpath() -> str:
-    root = _repo_root()
-    return os.pathsep.join(
-        [
-            str(root / "packages" / "protocol" / "src"),
-            str(root / "apps" / "evidence_service" / "src"),
-            str(root / "apps" / "provider_api" / "src"),
-            str(root / "apps" / "judge_service" / "src"),
-            str(root / "apps" / "reputation_service" / "src"),
-            str(root / "apps" / "consumer_agent" / "src"),
-            str(root / "apps" / "demo_runner" / "src"),
-        ]
-    )
+_MODULE_PYTHONPATH = os.pathsep.join(
+    str(_repo_root() / rel)
+    for rel in [
+        "packages/protocol/src",
+        "apps/evidence_service/src",
+        "apps/provider_api/src",
+        "apps/judge_service/src",
+        "apps/reputation_service/src",
+        "apps/consumer_agent/src",
+        "apps/demo_runner/src",
+    ]
+)
 
 
 def _base_env() -> dict[str, str]:
     env = os.environ.copy()
     if env.get("PYTHONPATH"):
-        env["PYTHONPATH"] = os.pathsep.join([_module_pythonpath(), env["PYTHONPATH"]])
+        env["PYTHONPATH"] = os.pathsep.join([_MODULE_PYTHONPATH, env["PYTHONPATH"]])
     else:
-        env["PYTHONPATH"] = _module_pythonpath()
+        env["PYTHONPATH"] = _MODULE_PYTHONPATH
     env["PYTHONUNBUFFERED"] = "1"
     return env
 
@@ -112,9 +137,22 @@ def _sqlite_path_for_service(env: dict[str, str], service_name: str) -> str | No
     return str(base_path.with_name(f"{base_path.name}_{service_name}.db"))
 
 
+_TX_KEYS = ("depositTx", "bondTx", "disputeTx", "txHash")
+
+
 def _explorer_link(tx_hash: str) -> str:
-    explorer = os.environ.get("GOAT_EXPLORER_URL", "https://explorer.testnet3.goat.network")
-    return f"{explorer}/tx/{tx_hash}"
+    return f"{_EXPLORER_URL}/tx/{tx_hash}"
+
+
+_EVENT_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+
+def _sse_frame(event: dict[str, Any]) -> bytes:
+    return b"data: " + _EVENT_ENCODER.encode(event).encode() + b"\n\n"
+
+
+# Per-run cap on retained events; older ones fall off and are not replayed to late watchers.
+_MAX_EVENTS = int(os.environ.get("DEMO_MAX_EVENTS", "2048"))
 
 
 @dataclass(slots=True)
@@ -122,12 +160,18 @@ class DemoRun:
     run_id: str
     mode: str
     status: str = "pending"
-    start_ms: int = field(default_factory=lambda: int(time.time() * 1000))
-    update_ms: int = field(default_factory=lambda: int(time.time() * 1000))
+    start_ms: int = 0
+    update_ms: int = 0
     current_step: str | None = None
     steps: list[dict[str, Any]] = field(default_factory=list)
     artifacts: dict[str, Any] = field(default_factory=dict)
-    events: list[dict[str, Any]] = field(default_factory=list)
+    events: deque[dict[str, Any]] = field(default_factory=lambda: deque(maxlen=_MAX_EVENTS))
+    # Each event as a ready-to-send SSE frame (bytes), encoded once and shared by every watcher.
+    wire: deque[bytes] = field(default_factory=lambda: deque(maxlen=_MAX_EVENTS), repr=False)
+    # Total events ever emitted; unlike len(events) it keeps growing once the buffer is full.
+    event_count: int = 0
+    # stepId -> index into `steps`, so step updates don't rescan the list.
+    _steps_by_id: dict[str, int] = field(default_factory=dict, init=False, repr=False)
     agreement_ids: list[str] = field(default_factory=list)
     dispute_ids: list[str] = field(default_factory=list)
     start_services: bool = True
@@ -135,17 +179,28 @@ class DemoRun:
     cancel_requested: bool = False
     error: str | None = None
 
-    def emit(self, event: dict[str, Any]) -> None:
+    def __post_init__(self) -> None:
+        if not self.start_ms:
+            self.start_ms = time.time_ns() // 1_000_000
+        if not self.update_ms:
+            self.update_ms = self.start_ms
+
+    def emit(self, event: dict[str, Any]) -> bytes:
         if "runId" not in event:
             event["runId"] = self.run_id
-        event.setdefault("atMs", int(time.time() * 1000))
+        # One clock read stamps both the event and the run.
+        now_ms = event.get("atMs") or time.time_ns() // 1_000_000
+        event["atMs"] = now_ms
 
+        payload = _sse_frame(event)
         self.events.append(event)
-        self.update_ms = int(time.time() * 1000)
+        self.wire.append(payload)
+        self.event_count += 1
+        self.update_ms = now_ms
 
         step_id = event.get("stepId")
         if not step_id:
-            return
+            return payload
         run_events = {
             "step.started",
             "step.updated",
@@ -158,12 +213,14 @@ class DemoRun:
             if event.get("type") in {"step.started", "step.updated"}:
                 self.current_step = step_id
 
-            for idx, existing in enumerate(self.steps):
-                if existing.get("stepId") == step_id:
-                    self.steps[idx] = {**existing, **event}
-                    break
+            idx = self._steps_by_id.get(step_id)
+            if idx is not None:
+                self.steps[idx].update(event)
             else:
-                self.steps.append(event)
+                # Steps own a copy, so later in-place updates never rewrite `events` history.
+                self._steps_by_id[step_id] = len(self.steps)
+                self.steps.append(dict(event))
+        return payload
 
 
 @dataclass(slots=True)
@@ -177,29 +234,62 @@ class _ServiceProcess:
     def start(self) -> None:
         if self.proc is not None and self.proc.poll() is None:
             return
+        # Own session per service, so kill() can take down anything the service spawned.
         self.proc = subprocess.Popen(
             self.cmd,
             stdout=sys.stdout,
             stderr=sys.stderr,
             env=self.env,
+            start_new_session=True,
         )
 
-    def stop(self) -> None:
-        if not self.proc or self.proc.poll() is not None:
+    def running(self) -> bool:
+        return self.proc is not None and self.proc.poll() is None
+
+    def _signal_group(self, sig: signal.Signals) -> None:
+        # Signal the whole session, since uvicorn workers or anything else the service
+        # spawned may outlive the leader. Until we reap the leader its pid (the group id)
+        # cannot be reused. After that the id is only held while some member lives, so
+        # probe the group first; that narrows, but does not close, the reuse window.
+        if self.proc is None:
             return
-        self.proc.terminate()
-        try:
-            self.proc.wait(timeout=8)
-        except subprocess.TimeoutExpired:
-            self.proc.kill()
+        if not hasattr(os, "killpg"):
+            if self.proc.poll() is None:
+                self.proc.send_signal(sig)
+            return
+        with contextlib.suppress(ProcessLookupError, PermissionError):
+            if self.proc.returncode is not None:
+                os.killpg(self.proc.pid, 0)
+            os.killpg(self.proc.pid, sig)
+
+    def terminate(self) -> None:
+        self._signal_group(signal.SIGTERM)
+
+    def wait(self, timeout: float) -> None:
+        if self.proc is None:
+            return
+        with contextlib.suppress(subprocess.TimeoutExpired):
+            self.proc.wait(timeout=timeout)
+
+    def kill(self) -> None:
+        if self.proc is None:
+            return
+        self._signal_group(getattr(signal, "SIGKILL", signal.SIGTERM))
+        with contextlib.suppress(subprocess.TimeoutExpired):
             self.proc.wait(timeout=3)
 
+    def stop(self) -> None:
+        self.terminate()
+        self.wait(timeout=8)
+        self.kill()
+
 
 class DemoRunManager:
     def __init__(self) -> None:
         self._runs: dict[str, DemoRun] = {}
         self._tasks: dict[str, asyncio.Task[None]] = {}
-        self._watchers: dict[str, list[asyncio.Queue[str]]] = {}
+        # Copy-on-write tuples: (un)subscribe swaps in a new tuple, broadcasts iterate as-is.
+        self._watchers: dict[str, tuple[asyncio.Queue[bytes], ...]] = {}
         self._services: list[_ServiceProcess] = []
         self.env = _base_env()
         self._service_defs = [
@@ -208,7 +298,19 @@ class DemoRunManager:
             ("judge", [sys.executable, "-m", "judge_service.server"], "http://127.0.0.1:4002/health"),
             ("reputation", [sys.executable, "-m", "reputation_service.api"], "http://127.0.0.1:4003/health"),
         ]
+        # Both inputs are fixed for the manager's lifetime, so resolve the paths once.
+        self._sqlite_paths = {
+            name: _sqlite_path_for_service(self.env, name) for name, _, _ in self._service_defs
+        }
         self._flow_module = None
+        # Shared by every health probe; created lazily and dropped when services stop.
+        self._http: httpx.AsyncClient | None = None
+        # Flow threads hand events to one long-lived broadcaster instead of a task per event.
+        # Both are created lazily because the manager is built before the event loop runs.
+        self._broadcast_queue: asyncio.Queue[tuple[str, bytes]] | None = None
+        self._broadcaster_task: asyncio.Task[None] | None = None
+        # Flows get their own small pool instead of competing in the default to_thread executor.
+        self._flow_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="flow")
 
     def create_run(
         self,
@@ -231,7 +333,7 @@ class DemoRunManager:
         )
         run.artifacts["agreementWindowSec"] = agreement_window_sec
         self._runs[run_id] = run
-        self._watchers[run_id] = []
+        self._watchers[run_id] = ()
 
         if auto_run:
             run.status = "queued"
@@ -320,81 +422,158 @@ class DemoRunManager:
             await task
         return True
 
-    def subscribe(self, run_id: str) -> asyncio.Queue[str]:
-        queue: asyncio.Queue[str] = asyncio.Queue()
-        self._watchers.setdefault(run_id, []).append(queue)
+    def subscribe(self, run_id: str) -> asyncio.Queue[bytes]:
+        queue: asyncio.Queue[bytes] = asyncio.Queue()
+        self._watchers[run_id] = self._watchers.get(run_id, ()) + (queue,)
         run = self._runs.get(run_id)
         if not run:
-            queue.put_nowait(
-                json.dumps(
-                    {"type": "run.unknown", "message": "Run not found"},
-                    separators=(",", ":"),
-                )
-            )
-            queue.put_nowait("")
+            queue.put_nowait(_sse_frame({"type": "run.unknown", "message": "Run not found"}))
+            queue.put_nowait(b"")
             return queue
-        for event in run.events:
-            queue.put_nowait(json.dumps(event, separators=(",", ":")))
+        # The whole history goes out as one chunk of frames; the snapshot guards
+        # against flow threads appending while we join.
+        if run.wire:
+            queue.put_nowait(b"".join(list(run.wire)))
         return queue
 
-    async def _broadcast(self, run_id: str, event: dict[str, Any]) -> None:
-        for queue in list(self._watchers.get(run_id, [])):
+    def unsubscribe(self, run_id: str, queue: asyncio.Queue[bytes]) -> None:
+        watchers = self._watchers.get(run_id)
+        if watchers is not None:
+            self._watchers[run_id] = tuple(q for q in watchers if q is not queue)
+
+    async def _broadcast(self, run_id: str, payload: bytes) -> None:
+        for queue in self._watchers.get(run_id, ()):
             try:
-                queue.put_nowait(json.dumps(event, separators=(",", ":")))
+                queue.put_nowait(payload)
             except Exception:
                 pass
 
+    def _ensure_broadcaster(self) -> asyncio.Queue[tuple[str, bytes]]:
+        if self._broadcaster_task is None or self._broadcaster_task.done():
+            self._broadcast_queue = asyncio.Queue()
+            self._broadcaster_task = asyncio.create_task(
+                self._broadcast_loop(self._broadcast_queue),
+                name="demo-run-broadcaster",
+            )
+        assert self._broadcast_queue is not None
+        return self._broadcast_queue
+
+    async def _broadcast_loop(self, queue: asyncio.Queue[tuple[str, bytes]]) -> None:
+        while True:
+            # Drain whatever a burst of flow events queued up and hand each watcher one
+            # joined chunk per run; SSE frames concatenate cleanly.
+            batch = [await queue.get()]
+            while len(batch) < 64:
+                try:
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            by_run: dict[str, list[bytes]] = {}
+            for run_id, payload in batch:
+                by_run.setdefault(run_id, []).append(payload)
+            for run_id, payloads in by_run.items():
+                await self._broadcast(run_id, b"".join(payloads))
+
     async def _publish(self, run: DemoRun, event: dict[str, Any]) -> None:
-        run.emit(event)
-        await self._broadcast(run.run_id, run.events[-1])
+        await self._broadcast(run.run_id, run.emit(event))
 
-    async def _service_health_wait(self, url: str, timeout: float = 45.0) -> None:
+    def _health_client(self) -> httpx.AsyncClient:
         import httpx
 
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                timeout=httpx.Timeout(2.0),
+                limits=httpx.Limits(max_keepalive_connections=8),
+            )
+        return self._http
+
+    async def aclose(self) -> None:
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    def close(self) -> None:
+        self._flow_pool.shutdown(wait=False, cancel_futures=True)
+
+    async def _probe_http(self, url: str) -> bool:
+        response = await self._health_client().get(url)
+        return response.status_code < 500
+
+    @staticmethod
+    async def _probe_tcp(host: str, port: int) -> bool:
+        # uvicorn only binds its socket after app startup, so an accepted connection
+        # means the service is up; the first real request validates the app itself.
+        _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), 0.5)
+        writer.close()
+        with contextlib.suppress(Exception):
+            await writer.wait_closed()
+        return True
+
+    async def _service_health_wait(self, url: str, timeout: float = 45.0) -> None:
+        use_http = os.environ.get("DEMO_HEALTH_MODE", "tcp").lower() == "http"
+        parts = urlsplit(url)
+        host, port = parts.hostname or "127.0.0.1", parts.port or 80
         start = time.time()
+        # Back off from 50ms to 1s so fast services are picked up almost immediately.
+        delay = 0.05
         while time.time() - start < timeout:
             try:
-                async with httpx.AsyncClient(timeout=2) as client:
-                    response = await client.get(url)
-                if response.status_code < 500:
+                if await (self._probe_http(url) if use_http else self._probe_tcp(host, port)):
                     return
             except Exception:
                 pass
-            await asyncio.sleep(1)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 1.0)
         raise TimeoutError(f"service did not become healthy: {url}")
 
+    async def _wait_and_publish(
+        self,
+        run: DemoRun,
+        name: str,
+        health_url: str,
+        *,
+        label: str,
+        message: str,
+        timeout: float = 45.0,
+    ) -> None:
+        await self._service_health_wait(health_url, timeout=timeout)
+        await self._publish(
+            run,
+            {
+                "type": "run.info",
+                "stepId": f"service:{name}",
+                "label": label,
+                "status": "done",
+                "message": message,
+            },
+        )
+
     async def _start_services(self, run: DemoRun) -> None:
+        # Services are independent, so their health waits run concurrently and boot
+        # time is bounded by the slowest service rather than the sum of all of them.
         if not run.start_services:
-            for name, _, health_url in self._service_defs:
-                await self._service_health_wait(health_url, timeout=5.0)
-                await self._publish(
-                    run,
-                    {
-                        "type": "run.info",
-                        "stepId": f"service:{name}",
-                        "label": f"{name} (existing)",
-                        "status": "done",
-                        "message": "Using existing service",
-                    },
+            await asyncio.gather(
+                *(
+                    self._wait_and_publish(
+                        run,
+                        name,
+                        health_url,
+                        label=f"{name} (existing)",
+                        message="Using existing service",
+                        timeout=5.0,
+                    )
+                    for name, _, health_url in self._service_defs
                 )
+            )
             return
 
-        self._services = [
-            _ServiceProcess(
-                name,
-                cmd,
-                url,
-                {
-                    **self.env,
-                    **(
-                        {"SQLITE_PATH": sqlite_path}
-                        if (sqlite_path := _sqlite_path_for_service(self.env, name))
-                        else {}
-                    ),
-                },
-            )
-            for name, cmd, url in self._service_defs
-        ]
+        base = self.env
+        self._services = []
+        for name, cmd, url in self._service_defs:
+            # Only services with their own SQLite path need an env copy; others share `base`.
+            sqlite_path = self._sqlite_paths[name]
+            env = {**base, "SQLITE_PATH": sqlite_path} if sqlite_path else base
+            self._services.append(_ServiceProcess(name, cmd, url, env))
 
         for service in self._services:
             await self._publish(
@@ -409,25 +588,34 @@ class DemoRunManager:
             )
             service.start()
 
-        for service in self._services:
-            await self._service_health_wait(service.health_url)
-            await self._publish(
-                run,
-                {
-                    "type": "run.info",
-                    "stepId": f"service:{service.name}",
-                    "label": f"{service.name}",
-                    "status": "done",
-                    "message": "Ready",
-                },
+        await asyncio.gather(
+            *(
+                self._wait_and_publish(
+                    run,
+                    service.name,
+                    service.health_url,
+                    label=service.name,
+                    message="Ready",
+                )
+                for service in self._services
             )
+        )
 
     async def _stop_services(self, run: DemoRun) -> None:
+        await self.aclose()
         if not run.start_services or run.keep_services:
             return
-        for service in self._services:
-            service.stop()
-        self._services = []
+        # Signal every service first and wait for them together, so a slow shutdown
+        # costs one timeout rather than one per service.
+        services, self._services = self._services, []
+        for service in services:
+            service.terminate()
+        await asyncio.gather(
+            *(asyncio.to_thread(service.wait, 8) for service in services),
+            return_exceptions=True,
+        )
+        for service in services:
+            service.kill()
 
     async def _run_agent_flow(
         self,
@@ -439,6 +627,7 @@ class DemoRunManager:
         loop = asyncio.get_running_loop()
         if run.cancel_requested:
             raise RuntimeError("run cancelled")
+        broadcast_queue = self._ensure_broadcaster()
 
         step_id = f"run:{flow_name}"
         await self._publish(
@@ -456,16 +645,12 @@ class DemoRunManager:
             if run.cancel_requested:
                 return
             event["runId"] = run.run_id
-            run.emit(event)
-            loop.call_soon_threadsafe(
-                asyncio.create_task,
-                self._broadcast(run.run_id, event),
-            )
+            payload = run.emit(event)
+            loop.call_soon_threadsafe(broadcast_queue.put_nowait, (run.run_id, payload))
 
-        result = await asyncio.to_thread(
-            flow_fn,
-            emit=emit,
-            agreement_window_sec=agreement_window_sec,
+        result = await loop.run_in_executor(
+            self._flow_pool,
+            functools.partial(flow_fn, emit=emit, agreement_window_sec=agreement_window_sec),
         )
 
         await self._publish(
@@ -590,12 +775,12 @@ class DemoRunManager:
             for prefix, result in list(run.artifacts.items()):
                 if not isinstance(result, dict):
                     continue
-                for tx_key in ("depositTx", "bondTx", "disputeTx", "txHash"):
+                for tx_key in _TX_KEYS:
                     tx_value = result.get(tx_key)
                     if not tx_value:
                         continue
                     run.artifacts[f"{prefix}:{tx_key}"] = tx_value
-                    if str(tx_value).startswith("0x"):
+                    if isinstance(tx_value, str) and tx_value.startswith("0x"):
                         run.artifacts[f"{prefix}:{tx_key}:explorer"] = _explorer_link(
                             tx_value
                         )
@@ -645,12 +830,9 @@ class DemoRunManager:
     def health(self) -> dict[str, Any]:
         return {
             "status": "ok",
-            "contractAddress": os.environ.get(
-                "ESCROW_CONTRACT_ADDRESS",
-                "0xFBf9b5293A1737AC53880d3160a64B49bA54801D",
-            ),
-            "chainId": int(os.environ.get("GOAT_CHAIN_ID", "48816")),
-            "chainRpc": os.environ.get("GOAT_RPC_URL", "https://rpc.testnet3.goat.network"),
+            "contractAddress": _CONTRACT_ADDR,
+            "chainId": _CHAIN_ID,
+            "chainRpc": _CHAIN_RPC,
             "ports": {
                 "evidence": 4001,
                 "provider": 4000,
@@ -661,13 +843,20 @@ class DemoRunManager:
         }
 
 
-_MANAGER: DemoRunManager | None = None
+# Built at import so get_manager() is a plain read with no race on first use;
+# DEMO_RUNNER_LAZY=1 defers construction to the first call (under a lock).
+_MANAGER: DemoRunManager | None = (
+    None if os.environ.get("DEMO_RUNNER_LAZY") == "1" else DemoRunManager()
+)
+_MANAGER_LOCK = threading.Lock()
 
 
 def get_manager() -> DemoRunManager:
     global _MANAGER
     if _MANAGER is None:
-        _MANAGER = DemoRunManager()
+        with _MANAGER_LOCK:
+            if _MANAGER is None:
+                _MANAGER = DemoRunManager()
     return _MANAGER
 
 
@@ -4,11 +4,18 @@ import base64
 import json
 import os
 import time
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+from pathlib import Path
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from web3 import Web3
+from web3.contract import Contract
 
 GOAT_MAINNET_RPC = "https://rpc.goat.network"
 GOAT_TESTNET3_RPC = "https://rpc.testnet3.goat.network"
@@ -19,6 +26,13 @@ IDENTITY_TESTNET3 = "0x556089008Fc0a60cD09390Eca93477ca254A5522"
 REGISTRATION_TOPIC = "0xca52e62c367d81bb2e328eb795f7c7ba24afb478408a26c0e201d155c449bc4a"
 USDC = "0x29d1ee93e9ecf6e50f309f498e40a6b42d352fa1"
 USDT = "0xdce0af57e8f2ce957b3838cd2a2f3f3677965dd3"
+# ERC-8004 identity registries to scan, grouped by RPC host so each host gets one batch.
+IDENTITY_REGISTRIES: dict[str, tuple[str, ...]] = {
+    GOAT_MAINNET_RPC: (IDENTITY_MAINNET,),
+    GOAT_TESTNET3_RPC: (IDENTITY_TESTNET3,),
+}
+# Block span per eth_getLogs window when a node rejects an open-ended range.
+_LOG_RANGE = 100_000
 DEFAULT_AGENT_NAME = "Verdict Protocol Operator"
 DEFAULT_AGENT_DESCRIPTION = "Agent identity for Verdict Protocol payment and arbitration flows"
 
@@ -64,8 +78,29 @@ IDENTITY_ABI = [
 ]
 
 
-def _bool_env(name: str, default: bool = False) -> bool:
-    value = os.environ.get(name)
+_checksum = lru_cache(maxsize=256)(Web3.to_checksum_address)
+
+
+@lru_cache(maxsize=4)
+def _web3(rpc_url: str) -> Web3:
+    # One client per RPC URL so repeat in-process runs reuse its connection pool
+    # and the contract caches below, which are keyed by the Web3 instance.
+    return Web3(Web3.HTTPProvider(rpc_url))
+
+
+@lru_cache(maxsize=64)
+def _erc20(w3: Web3, address: str) -> Contract:
+    # Parsing the ABI into function proxies is the expensive part; do it once per token.
+    return w3.eth.contract(address=_checksum(address), abi=ERC20_ABI)
+
+
+@lru_cache(maxsize=8)
+def _identity_registry(w3: Web3, address: str) -> Contract:
+    return w3.eth.contract(address=_checksum(address), abi=IDENTITY_ABI)
+
+
+def _bool_env(name: str, default: bool = False, env: Mapping[str, str] | None = None) -> bool:
+    value = (os.environ if env is None else env).get(name)
     if value is None:
         return default
     return value.strip().lower() in {"1", "true", "yes", "on"}
@@ -77,54 +112,191 @@ def _normalize_token(token_or_address: str) -> tuple[str, str]:
         return USDC, "USDC"
     if value == "USDT":
         return USDT, "USDT"
-    return Web3.to_checksum_address(token_or_address), "CUSTOM"
+    return _checksum(token_or_address), "CUSTOM"
+
+
+_http = requests.Session()
+# Keep-alive pool shared by the RPC, explorer and faucet calls. Retry only covers
+# idempotent methods by default, so faucet POSTs are never replayed.
+_http.mount(
+    "https://",
+    HTTPAdapter(
+        pool_maxsize=10,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504)),
+    ),
+)
+
+
+def _rpc_batch(rpc_url: str, calls: Sequence[tuple[str, list[Any]]]) -> list[Any]:
+    payload = [
+        {"jsonrpc": "2.0", "id": idx, "method": method, "params": params}
+        for idx, (method, params) in enumerate(calls)
+    ]
+    response = _http.post(rpc_url, json=payload, timeout=30)
+    response.raise_for_status()
+    body = response.json()
+    # Nodes answer a rejected batch with a single error object rather than a list.
+    replies = body if isinstance(body, list) else [body]
+    results: list[Any] = [None] * len(calls)
+    for reply in replies:
+        if "error" in reply:
+            raise RuntimeError(f"rpc error while loading agent logs: {reply['error']}")
+        results[reply["id"]] = reply.get("result")
+    return results
 
 
-def _fetch_registration_logs(rpc_url: str, contract_address: str) -> list[dict[str, Any]]:
-    payload = {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "method": "eth_getLogs",
-        "params": [
-            {
-                "address": contract_address,
-                "fromBlock": "0x0",
-                "toBlock": "latest",
-                "topics": [REGISTRATION_TOPIC],
-            }
-        ],
+def _registration_filter(contract_address: str, from_block: str, to_block: str) -> dict[str, Any]:
+    return {
+        "address": contract_address,
+        "fromBlock": from_block,
+        "toBlock": to_block,
+        "topics": [REGISTRATION_TOPIC],
     }
-    response = requests.post(rpc_url, json=payload, timeout=30)
-    response.raise_for_status()
-    body = response.json()
-    if "error" in body:
-        raise RuntimeError(f"rpc error while loading agent logs: {body['error']}")
-    return body.get("result", [])
 
 
-def _load_agent_wallets() -> set[str]:
-    all_logs: list[dict[str, Any]] = []
-    all_logs.extend(_fetch_registration_logs(GOAT_MAINNET_RPC, IDENTITY_MAINNET))
-    all_logs.extend(_fetch_registration_logs(GOAT_TESTNET3_RPC, IDENTITY_TESTNET3))
-    wallets: set[str] = set()
-    for log in all_logs:
-        topics = log.get("topics", [])
-        if len(topics) < 3:
-            continue
-        wallets.add(("0x" + topics[2][-40:]).lower())
-    return wallets
+def _fetch_registration_logs(
+    rpc_url: str, contract_addresses: Sequence[str], from_block: int = 0
+) -> tuple[int, list[dict[str, Any]]]:
+    """Return (head block, registration logs in `from_block`..head) for one RPC host.
+
+    The head is read on its own first and every log query is bounded by it, so the
+    returned cursor never runs ahead of the logs actually fetched, even when batch items
+    are answered out of order or by different nodes behind a load balancer.
+    """
+    head = int(_rpc_batch(rpc_url, [("eth_blockNumber", [])])[0], 16)
+    if from_block > head:
+        return head, []
+    calls = [
+        ("eth_getLogs", [_registration_filter(address, hex(from_block), hex(head))])
+        for address in contract_addresses
+    ]
+    try:
+        results = _rpc_batch(rpc_url, calls)
+        return head, [log for result in results for log in result or []]
+    except RuntimeError:
+        pass
+
+    # Some nodes cap the block span of eth_getLogs; walk the range in fixed windows.
+    logs: list[dict[str, Any]] = []
+    for start in range(from_block, head + 1, _LOG_RANGE):
+        end = min(start + _LOG_RANGE - 1, head)
+        window = [
+            ("eth_getLogs", [_registration_filter(address, hex(start), hex(end))])
+            for address in contract_addresses
+        ]
+        for result in _rpc_batch(rpc_url, window):
+            logs.extend(result or [])
+    return head, logs
+
+
+def _agent_cache_path(env: Mapping[str, str] | None = None) -> Path:
+    value = (os.environ if env is None else env).get("DASHBOARD_AGENT_CACHE")
+    return Path(value or Path.home() / ".cache" / "verdict" / "agent_wallets.json").expanduser()
+
+
+def _read_agent_cache(path: Path) -> dict[str, Any]:
+    try:
+        data = json.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _write_agent_cache(path: Path, data: dict[str, Any]) -> None:
+    # Best effort: a read-only home only costs a full rescan next time.
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def _load_agent_wallets(cache_path: Path | None = None) -> set[str]:
+    """Collect ERC-8004 agent owner wallets, scanning only blocks newer than the cache."""
+    path = cache_path or _agent_cache_path()
+    cache = _read_agent_cache(path)
+
+    def scan(item: tuple[str, tuple[str, ...]]) -> tuple[str, dict[str, Any]]:
+        rpc_url, addresses = item
+        entry = cache.get(rpc_url)
+        if not (
+            isinstance(entry, dict)
+            and entry.get("addresses") == list(addresses)
+            and isinstance(entry.get("block"), int)
+        ):
+            entry = {"block": -1, "wallets": []}
+        head, logs = _fetch_registration_logs(rpc_url, addresses, entry["block"] + 1)
+        # topics[2] is the 32-byte padded owner address; keep its low 20 bytes.
+        wallets = set(entry["wallets"])
+        wallets.update(
+            "0x" + topics[2][-40:].lower()
+            for topics in (log.get("topics", ()) for log in logs)
+            if len(topics) >= 3
+        )
+        return rpc_url, {"addresses": list(addresses), "block": head, "wallets": sorted(wallets)}
+
+    # Hosts are independent, so scan them concurrently.
+    with ThreadPoolExecutor(max_workers=len(IDENTITY_REGISTRIES)) as pool:
+        updated = dict(pool.map(scan, IDENTITY_REGISTRIES.items()))
+    _write_agent_cache(path, {**cache, **updated})
+    return {wallet for entry in updated.values() for wallet in entry["wallets"]}
 
 
 def _pick_recipient(sender: str, agent_wallets: set[str], explicit: str | None) -> str:
     if explicit:
-        return Web3.to_checksum_address(explicit)
-    for address in sorted(agent_wallets):
-        if address != sender.lower():
-            return Web3.to_checksum_address(address)
-    raise RuntimeError(
-        "No candidate agent wallet found from ERC-8004 logs. "
-        "Set DASHBOARD_AGENT_RECIPIENT explicitly."
-    )
+        return _checksum(explicit)
+    # Lowest address other than the sender, same pick as scanning sorted(agent_wallets).
+    sender_lower = sender.lower()
+    address = min((a for a in agent_wallets if a != sender_lower), default=None)
+    if address is None:
+        raise RuntimeError(
+            "No candidate agent wallet found from ERC-8004 logs. "
+            "Set DASHBOARD_AGENT_RECIPIENT explicitly."
+        )
+    return _checksum(address)
+
+
+def _read_payer_state(w3: Web3, token: Contract, sender: str) -> dict[str, Any]:
+    """Read token metadata, payer balances and nonce in one JSON-RPC batch.
+
+    Falls back to individual calls if the node rejects batches or any call fails,
+    which keeps the old per-call defaults for tokens without symbol/decimals.
+    """
+    try:
+        with w3.batch_requests() as batch:
+            batch.add(token.functions.symbol())
+            batch.add(token.functions.decimals())
+            batch.add(w3.eth.get_balance(sender))
+            batch.add(token.functions.balanceOf(sender))
+            batch.add(w3.eth.get_transaction_count(sender))
+            symbol, decimals, native, token_balance, nonce = batch.execute()
+        return {
+            "symbol": symbol,
+            "decimals": int(decimals),
+            "native": int(native),
+            "token": int(token_balance),
+            "nonce": int(nonce),
+        }
+    except Exception:
+        pass
+
+    try:
+        symbol = token.functions.symbol().call()
+    except Exception:
+        symbol = None
+    try:
+        decimals = int(token.functions.decimals().call())
+    except Exception:
+        decimals = None
+    return {
+        "symbol": symbol,
+        "decimals": decimals,
+        "native": int(w3.eth.get_balance(sender)),
+        "token": int(token.functions.balanceOf(sender).call()),
+        "nonce": int(w3.eth.get_transaction_count(sender)),
+    }
 
 
 def _amount_to_base_units(amount: str, decimals: int) -> int:
@@ -138,17 +310,31 @@ def _amount_to_base_units(amount: str, decimals: int) -> int:
     return int((decimal_amount * scale).to_integral_value())
 
 
+# feed url -> conditional-request headers from the last 200, so unchanged polls get a 304.
+_feed_validators: dict[str, dict[str, str]] = {}
+
+
 def _find_in_explorer_feed(explorer_url: str, token_address: str, tx_hash: str) -> bool:
     url = f"{explorer_url.rstrip('/')}/api/v2/token-transfers?token_address={token_address}"
-    response = requests.get(url, timeout=20)
+    response = _http.get(url, headers=_feed_validators.get(url), timeout=20)
+    if response.status_code == 304:
+        # Feed unchanged since the last miss, so the tx still isn't in it.
+        return False
     response.raise_for_status()
-    items = response.json().get("items", [])
+    validators = {}
+    if etag := response.headers.get("ETag"):
+        validators["If-None-Match"] = etag
+    if last_modified := response.headers.get("Last-Modified"):
+        validators["If-Modified-Since"] = last_modified
+    _feed_validators[url] = validators
+    # Parse straight from bytes (no text decode); the scan stops at the first match.
+    items = json.loads(response.content).get("items", [])
     target = tx_hash.lower()
-    return any(item.get("transaction_hash", "").lower() == target for item in items)
+    return any((item.get("transaction_hash") or "").lower() == target for item in items)
 
 
 def _request_faucet(evm_address: str, turnstile_token: str) -> dict[str, Any]:
-    response = requests.post(
+    response = _http.post(
         GOAT_FAUCET_API,
         json={"evm_address": evm_address, "token": turnstile_token},
         timeout=30,
@@ -169,6 +355,7 @@ def _request_faucet(evm_address: str, turnstile_token: str) -> dict[str, Any]:
     }
 
 
+@lru_cache(maxsize=32)
 def _metadata_uri(name: str, description: str) -> str:
     payload = {
         "name": name,
@@ -190,7 +377,7 @@ def _send_contract_tx(
     *,
     fallback_gas: int,
 ) -> tuple[str, int]:
-    sender = Web3.to_checksum_address(account.address)
+    sender = _checksum(account.address)
     gas_price = w3.eth.gas_price
     try:
         gas_limit = int(fn_call.estimate_gas({"from": sender}) * 1.2)
@@ -214,50 +401,52 @@ def _send_contract_tx(
     return tx_hash, nonce + 1
 
 
-def main() -> None:
-    rpc_url = os.environ.get("GOAT_RPC_URL", GOAT_TESTNET3_RPC)
-    chain_id = int(os.environ.get("GOAT_CHAIN_ID", "48816"))
-    explorer_url = os.environ.get("GOAT_EXPLORER_URL", "https://explorer.testnet3.goat.network")
+def run_dashboard_payment(env: Mapping[str, str] | None = None) -> dict[str, Any]:
+    """Run the dashboard payment (or its dry run) and return the result summary.
 
-    private_key = os.environ.get("DASHBOARD_PAYMENT_PRIVATE_KEY") or os.environ.get(
-        "CONSUMER_PRIVATE_KEY", ""
-    )
+    Settings are read from `env` (default: `os.environ`), so the runner can call this
+    in-process with per-request overrides.
+    """
+    if env is None:
+        env = os.environ
+
+    rpc_url = env.get("GOAT_RPC_URL", GOAT_TESTNET3_RPC)
+    chain_id = int(env.get("GOAT_CHAIN_ID", "48816"))
+    explorer_url = env.get("GOAT_EXPLORER_URL", "https://explorer.testnet3.goat.network")
+
+    private_key = env.get("DASHBOARD_PAYMENT_PRIVATE_KEY") or env.get("CONSUMER_PRIVATE_KEY", "")
     if not private_key:
         raise RuntimeError("Set DASHBOARD_PAYMENT_PRIVATE_KEY or CONSUMER_PRIVATE_KEY")
 
-    token_address, token_hint = _normalize_token(os.environ.get("DASHBOARD_PAYMENT_TOKEN", "USDC"))
-    amount_display = os.environ.get("DASHBOARD_PAYMENT_AMOUNT", "0.001")
-    explicit_recipient = os.environ.get("DASHBOARD_AGENT_RECIPIENT")
-    dry_run = _bool_env("DASHBOARD_PAYMENT_DRY_RUN", default=False)
-    register_agent = _bool_env("DASHBOARD_REGISTER_AGENT", default=False)
-    request_faucet = _bool_env("DASHBOARD_REQUEST_FAUCET", default=False)
-    faucet_turnstile_token = os.environ.get("GOAT_FAUCET_TURNSTILE_TOKEN", "")
-    wait_seconds = int(os.environ.get("DASHBOARD_PAYMENT_WAIT_SEC", "120"))
-    poll_seconds = float(os.environ.get("DASHBOARD_PAYMENT_POLL_SEC", "3"))
-    agent_name = os.environ.get("DASHBOARD_AGENT_NAME", DEFAULT_AGENT_NAME)
-    agent_description = os.environ.get("DASHBOARD_AGENT_DESCRIPTION", DEFAULT_AGENT_DESCRIPTION)
-
-    w3 = Web3(Web3.HTTPProvider(rpc_url))
+    token_address, token_hint = _normalize_token(env.get("DASHBOARD_PAYMENT_TOKEN", "USDC"))
+    amount_display = env.get("DASHBOARD_PAYMENT_AMOUNT", "0.001")
+    explicit_recipient = env.get("DASHBOARD_AGENT_RECIPIENT")
+    dry_run = _bool_env("DASHBOARD_PAYMENT_DRY_RUN", default=False, env=env)
+    register_agent = _bool_env("DASHBOARD_REGISTER_AGENT", default=False, env=env)
+    request_faucet = _bool_env("DASHBOARD_REQUEST_FAUCET", default=False, env=env)
+    faucet_turnstile_token = env.get("GOAT_FAUCET_TURNSTILE_TOKEN", "")
+    wait_seconds = int(env.get("DASHBOARD_PAYMENT_WAIT_SEC", "120"))
+    poll_seconds = float(env.get("DASHBOARD_PAYMENT_POLL_SEC", "3"))
+    agent_name = env.get("DASHBOARD_AGENT_NAME", DEFAULT_AGENT_NAME)
+    agent_description = env.get("DASHBOARD_AGENT_DESCRIPTION", DEFAULT_AGENT_DESCRIPTION)
+    agent_cache = _agent_cache_path(env)
+
+    w3 = _web3(rpc_url)
     account = w3.eth.account.from_key(private_key)
-    sender = Web3.to_checksum_address(account.address)
-    token = w3.eth.contract(address=Web3.to_checksum_address(token_address), abi=ERC20_ABI)
+    sender = _checksum(account.address)
+    token = _erc20(w3, token_address)
 
-    try:
-        symbol = token.functions.symbol().call()
-    except Exception:
-        symbol = token_hint
-    try:
-        decimals = int(token.functions.decimals().call())
-    except Exception:
-        decimals = 6
+    payer = _read_payer_state(w3, token, sender)
+    symbol = payer["symbol"] or token_hint
+    decimals = 6 if payer["decimals"] is None else payer["decimals"]
 
     amount_base = _amount_to_base_units(amount_display, decimals)
-    sender_native_balance = int(w3.eth.get_balance(sender))
-    sender_token_balance = int(token.functions.balanceOf(sender).call())
+    sender_native_balance = payer["native"]
+    sender_token_balance = payer["token"]
     metadata_uri = _metadata_uri(agent_name, agent_description)
     faucet_result: dict[str, Any] | None = None
 
-    agent_wallets = _load_agent_wallets()
+    agent_wallets = _load_agent_wallets(agent_cache)
     sender_is_agent = sender.lower() in agent_wallets
     recipient = _pick_recipient(sender, agent_wallets, explicit_recipient)
     recipient_is_agent = recipient.lower() in agent_wallets
@@ -290,8 +479,7 @@ def main() -> None:
                 "+ token balance"
             ),
         }
-        print(json.dumps(result, indent=2))
-        return
+        return result
 
     if request_faucet:
         if not faucet_turnstile_token:
@@ -313,13 +501,10 @@ def main() -> None:
         )
 
     registration_tx: str | None = None
-    nonce = w3.eth.get_transaction_count(sender)
+    nonce = payer["nonce"]
 
     if register_agent:
-        identity = w3.eth.contract(
-            address=Web3.to_checksum_address(IDENTITY_TESTNET3),
-            abi=IDENTITY_ABI,
-        )
+        identity = _identity_registry(w3, IDENTITY_TESTNET3)
         registration_tx, nonce = _send_contract_tx(
             w3,
             account,
@@ -330,7 +515,7 @@ def main() -> None:
         )
         # Give indexers a short head start before we rely on refreshed wallet set.
         time.sleep(4)
-        agent_wallets = _load_agent_wallets()
+        agent_wallets = _load_agent_wallets(agent_cache)
 
     sender_is_agent = sender.lower() in agent_wallets
     recipient_is_agent = recipient.lower() in agent_wallets
@@ -353,6 +538,8 @@ def main() -> None:
 
     visible_in_feed = False
     deadline = time.time() + wait_seconds
+    delay = poll_seconds
+    max_poll_seconds = max(poll_seconds, 10.0)
     while time.time() < deadline:
         try:
             if _find_in_explorer_feed(explorer_url, token_address, transfer_tx):
@@ -360,7 +547,8 @@ def main() -> None:
                 break
         except Exception:
             pass
-        time.sleep(poll_seconds)
+        time.sleep(min(delay, max(deadline - time.time(), 0)))
+        delay = min(delay * 1.5, max_poll_seconds)
 
     result = {
         "mode": "live",
@@ -385,7 +573,11 @@ def main() -> None:
         "visibleInDashboardFeed": visible_in_feed,
         "feedCheckWindowSec": wait_seconds,
     }
-    print(json.dumps(result, indent=2))
+    return result
+
+
+def main() -> None:
+    print(json.dumps(run_dashboard_payment(), indent=2))
 
 
 if __name__ == "__main__":
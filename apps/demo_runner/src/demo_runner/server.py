@@ -3,15 +3,19 @@ from __future__ import annotations
 import asyncio
 import json
 import os
+import sys
+import time
+from functools import lru_cache
 from typing import Any
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 from web3 import Web3
 
 from .orchestrator import get_manager, serialize_run
+from .push_dashboard_payment import run_dashboard_payment
 
 app = FastAPI(title="Verdict Demo Runner", version="0.1.1")
 app.add_middleware(
@@ -22,10 +26,58 @@ app.add_middleware(
 )
 manager = get_manager()
 
+
+@app.on_event("shutdown")
+async def shutdown() -> None:
+    await manager.aclose()
+    manager.close()
+
+
 DEFAULT_ESCROW_CONTRACT = "0xFBf9b5293A1737AC53880d3160a64B49bA54801D"
 
 
+# How long a contract sanity probe is reused; UIs poll /health and /config.
+_SANITY_TTL_SEC = float(os.environ.get("DEMO_SANITY_TTL_SEC", "5"))
+# (settings key, monotonic timestamp, payload) of the last probe.
+_sanity_cache: tuple[tuple[str | None, ...], float, dict[str, Any]] | None = None
+
+
+@lru_cache(maxsize=4)
+def _web3(rpc_url: str) -> Web3:
+    return Web3(Web3.HTTPProvider(rpc_url))
+
+
 def _contract_sanity() -> dict[str, Any]:
+    """Probe the escrow contract, reusing the last result for `_SANITY_TTL_SEC`.
+
+    /health and /config are sync routes, so FastAPI already runs this in its threadpool;
+    the cache keeps polling clients from turning into one RPC round trip per request.
+    """
+    global _sanity_cache
+    key = tuple(
+        os.environ.get(name)
+        for name in (
+            "GOAT_RPC_URL",
+            "ESCROW_CONTRACT_MODE",
+            "ESCROW_COURT_ADDRESS",
+            "ESCROW_CONTRACT_ADDRESS",
+            "ESCROW_DRY_RUN",
+            "ESCROW_VAULT_ADDRESS",
+            "ESCROW_JUDGE_REGISTRY_ADDRESS",
+            "ESCROW_REGISTRY_ADDRESS",
+            "ESCROW_EVIDENCE_ANCHOR_ADDRESS",
+        )
+    )
+    now = time.monotonic()
+    cached = _sanity_cache
+    if cached and cached[0] == key and now - cached[1] < _SANITY_TTL_SEC:
+        return dict(cached[2])
+    payload = _probe_contract()
+    _sanity_cache = (key, now, payload)
+    return dict(payload)
+
+
+def _probe_contract() -> dict[str, Any]:
     rpc_url = os.environ.get("GOAT_RPC_URL", "https://rpc.testnet3.goat.network")
     deployment_mode = os.environ.get("ESCROW_CONTRACT_MODE", "legacy").lower() or "legacy"
     contract_address = (
@@ -38,7 +90,7 @@ def _contract_sanity() -> dict[str, Any]:
     registry_address = os.environ.get("ESCROW_JUDGE_REGISTRY_ADDRESS") or os.environ.get("ESCROW_REGISTRY_ADDRESS")
     evidence_anchor_address = os.environ.get("ESCROW_EVIDENCE_ANCHOR_ADDRESS")
     try:
-        w3 = Web3(Web3.HTTPProvider(rpc_url))
+        w3 = _web3(rpc_url)
         connected = w3.is_connected()
         code_size = len(w3.eth.get_code(Web3.to_checksum_address(contract_address))) if connected else 0
         has_code = code_size > 0
@@ -182,11 +234,16 @@ async def start_run(run_id: str, payload: RunStartRequest) -> dict[str, Any]:
 
 
 @app.get("/runs/{run_id}")
-def get_run(run_id: str) -> dict[str, Any]:
+def get_run(run_id: str, request: Request) -> Response:
     run = manager.get(run_id)
     if not run:
         raise HTTPException(status_code=404, detail="run_not_found")
-    return serialize_run(run)
+    # Every run mutation that pollers care about either emits an event or flips
+    # status/error, so this tuple is enough to answer conditional GETs.
+    etag = f'W/"{run.update_ms}-{run.event_count}-{run.status}-{int(bool(run.error))}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return JSONResponse(serialize_run(run), headers={"ETag": etag})
 
 
 @app.post("/runs/{run_id}/cancel")
@@ -200,19 +257,22 @@ async def run_stream(run_id: str) -> StreamingResponse:
     queue = manager.subscribe(run_id)
 
     async def stream() -> Any:
-        # Replay existing events and then emit live updates.
+        # Replay existing events and then emit live updates. Queue items are already
+        # framed as SSE records (the replay arrives as one multi-record chunk).
         try:
             while True:
                 try:
                     message = await asyncio.wait_for(queue.get(), timeout=10)
                 except TimeoutError:
-                    yield ": keep-alive\n\n"
+                    yield b": keep-alive\n\n"
                     continue
                 if not message:
                     return
-                yield f"data: {message}\n\n"
+                yield message
         except asyncio.CancelledError:
             return
+        finally:
+            manager.unsubscribe(run_id, queue)
 
     return StreamingResponse(stream(), media_type="text/event-stream")
 
@@ -230,12 +290,17 @@ async def dashboard_payment(payload: DashboardPaymentRequest) -> dict[str, Any]:
     if payload.recipient:
         cmd_env["DASHBOARD_AGENT_RECIPIENT"] = payload.recipient
 
+    # In-process by default, which skips interpreter startup and keeps the payment module's
+    # caches warm; DEMO_DASHBOARD_SUBPROCESS=1 restores the isolated child process.
+    if os.environ.get("DEMO_DASHBOARD_SUBPROCESS") != "1":
+        try:
+            return await asyncio.to_thread(run_dashboard_payment, cmd_env)
+        except Exception as exc:
+            detail = str(exc) or "dashboard payment failed"
+            raise HTTPException(status_code=500, detail=detail) from exc
+
     proc = await asyncio.create_subprocess_exec(
-        "uv",
-        "run",
-        "--package",
-        "demo-runner",
-        "python",
+        sys.executable,
         "-m",
         "demo_runner.push_dashboard_payment",
         stdout=asyncio.subprocess.PIPE,
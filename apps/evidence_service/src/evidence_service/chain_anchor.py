@@ -1,7 +1,32 @@
 from __future__ import annotations
 
+from collections import OrderedDict
+
 from verdict_protocol import merkle_root_hash
 
+# agreementId -> (receipt count, last receiptHash, root). Receipt chains are append-only
+# and each receipt commits to its predecessor, so count + tip identify the whole list.
+# Bounded LRU so a long-running service does not keep one entry per agreement forever.
+_ROOT_CACHE: OrderedDict[str, tuple[int, str, str]] = OrderedDict()
+_ROOT_CACHE_MAX = 1024
+
 
 def compute_anchor_root(receipt_hashes: list[str]) -> str:
     return merkle_root_hash(receipt_hashes)
+
+
+def cached_anchor_root(agreement_id: str, receipt_hashes: list[str]) -> str:
+    """Return the anchor root for an agreement, reusing it while the chain is unchanged."""
+    if not receipt_hashes:
+        return "0x0"
+    count, tip = len(receipt_hashes), receipt_hashes[-1]
+    hit = _ROOT_CACHE.get(agreement_id)
+    if hit and hit[0] == count and hit[1] == tip:
+        _ROOT_CACHE.move_to_end(agreement_id)
+        return hit[2]
+    root = compute_anchor_root(receipt_hashes)
+    _ROOT_CACHE[agreement_id] = (count, tip, root)
+    _ROOT_CACHE.move_to_end(agreement_id)
+    if len(_ROOT_CACHE) > _ROOT_CACHE_MAX:
+        _ROOT_CACHE.popitem(last=False)
+    return root
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import os
+from collections import Counter
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from pydantic import BaseModel
 from verdict_protocol import (
     ArbitrationClause,
@@ -12,9 +13,10 @@ from verdict_protocol import (
     compute_receipt_hash,
     validate_schema,
     verify_receipt_chain,
+    verify_receipt_chain_append,
 )
 
-from .chain_anchor import compute_anchor_root
+from .chain_anchor import cached_anchor_root
 from .server_state import ServerState, get_state
 
 router = APIRouter()
@@ -64,7 +66,7 @@ def _agreement_snapshot(agreement_id: str, state: ServerState) -> dict[str, Any]
     expected_root = None
     root_match = None
     if anchor:
-        expected_root = compute_anchor_root([r["receiptHash"] for r in receipts]) if receipts else "0x0"
+        expected_root = cached_anchor_root(agreement_id, [r["receiptHash"] for r in receipts])
         root_match = expected_root == anchor["rootHash"]
 
     return {
@@ -135,11 +137,11 @@ def post_clause(payload: ArbitrationClause, state: ServerState = Depends(get_sta
 
 
 @router.get("/clauses/{agreement_id}")
-def get_clause(agreement_id: str, state: ServerState = Depends(get_state)) -> dict[str, Any]:
-    clause = state.storage.get_clause_by_agreement(agreement_id)
-    if not clause:
+def get_clause(agreement_id: str, state: ServerState = Depends(get_state)) -> Response:
+    payload = state.storage.get_clause_payload(agreement_id)
+    if payload is None:
         raise HTTPException(status_code=404, detail="clause not found")
-    return clause
+    return Response(content=payload, media_type="application/json")
 
 
 @router.get("/clauses")
@@ -168,15 +170,18 @@ def list_agreements(
     state: ServerState = Depends(get_state),
 ) -> dict[str, Any]:
     clauses = state.storage.list_clauses(limit=limit)
+    # Two batched lookups instead of a receipts + anchor query per agreement.
+    agreement_ids = [clause["agreementId"] for clause in clauses]
+    receipts_by_agreement = state.storage.list_receipts_for_agreements(agreement_ids)
+    anchors = state.storage.list_anchors_for_agreements(agreement_ids)
     items: list[dict[str, Any]] = []
     for clause in clauses:
         agreement_id = clause["agreementId"]
-        receipts = state.storage.list_receipts(agreement_id=agreement_id)
-        anchor = state.storage.get_anchor(agreement_id)
-        request_count = sum(1 for r in receipts if r.get("eventType") == "request")
-        response_count = sum(1 for r in receipts if r.get("eventType") == "response")
-        dispute_count = sum(1 for r in receipts if r.get("eventType") == "dispute_filed")
-        actors = sorted({str(r.get("actorId", "")) for r in receipts if r.get("actorId")})
+        receipts = receipts_by_agreement[agreement_id]
+        anchor = anchors.get(agreement_id)
+        event_counts = Counter(r.get("eventType") for r in receipts)
+        # actorId is a schema-validated DID string; the sort keeps the response order stable.
+        actors = sorted({r["actorId"] for r in receipts if r.get("actorId")})
         items.append(
             {
                 "agreementId": agreement_id,
@@ -185,9 +190,9 @@ def list_agreements(
                 "clauseHash": clause.get("clauseHash"),
                 "createdAt": clause.get("createdAt"),
                 "receiptCount": len(receipts),
-                "requestCount": request_count,
-                "responseCount": response_count,
-                "disputeReceiptCount": dispute_count,
+                "requestCount": event_counts["request"],
+                "responseCount": event_counts["response"],
+                "disputeReceiptCount": event_counts["dispute_filed"],
                 "actors": actors,
                 "anchor": anchor,
             }
@@ -195,9 +200,27 @@ def list_agreements(
     return {"count": len(items), "items": items}
 
 
+class BulkReceiptsRequest(BaseModel):
+    receipts: list[EventReceipt]
+
+
 @router.post("/receipts")
 def post_receipt(payload: EventReceipt, state: ServerState = Depends(get_state)) -> dict[str, Any]:
-    receipt = payload.model_dump()
+    return _ingest_receipt(payload.model_dump(), state)
+
+
+@router.post("/receipts:bulk")
+def post_receipts_bulk(
+    payload: BulkReceiptsRequest, state: ServerState = Depends(get_state)
+) -> dict[str, Any]:
+    """Ingest several receipts in order; all-or-nothing on the first rejected receipt."""
+    # One transaction for the whole batch; a rejection rolls back the receipts before it.
+    with state.storage.batch():
+        items = [_ingest_receipt(receipt.model_dump(), state) for receipt in payload.receipts]
+    return {"ok": True, "count": len(items), "items": items}
+
+
+def _ingest_receipt(receipt: dict[str, Any], state: ServerState) -> dict[str, Any]:
     errors = validate_schema("event_receipt.schema.json", receipt)
     if errors:
         raise HTTPException(status_code=400, detail=errors)
@@ -234,8 +257,8 @@ def post_receipt(payload: EventReceipt, state: ServerState = Depends(get_state))
             detail="receipt_sequence_conflict",
         )
 
-    existing = state.storage.list_receipts(agreement_id=receipt["agreementId"])
-    chain = verify_receipt_chain(existing + [receipt])
+    last = state.storage.get_last_receipt(receipt["agreementId"])
+    chain = verify_receipt_chain_append(last, receipt)
     if not chain.ok:
         raise HTTPException(status_code=400, detail=chain.errors)
 
@@ -251,18 +274,28 @@ def post_receipt(payload: EventReceipt, state: ServerState = Depends(get_state))
 def list_receipts(
     agreementId: str | None = Query(default=None),
     actorId: str | None = Query(default=None),
+    afterSequence: int | None = Query(default=None, ge=0),
+    limit: int | None = Query(default=None, ge=1, le=2000),
     state: ServerState = Depends(get_state),
-) -> dict[str, Any]:
-    receipts = state.storage.list_receipts(agreementId, actorId)
-    return {"count": len(receipts), "items": receipts}
+) -> Response:
+    # sequence is only unique within one agreement, so keyset paging needs one.
+    if afterSequence is not None and not agreementId:
+        raise HTTPException(status_code=400, detail="afterSequence_requires_agreementId")
+    # Receipts are stored as JSON documents; splice them into the envelope as-is instead
+    # of decoding every row only to encode it again. Unpaged unless limit is given.
+    payloads = state.storage.list_receipt_payloads(
+        agreementId, actorId, after_sequence=afterSequence, limit=limit
+    )
+    body = f'{{"count":{len(payloads)},"items":[{",".join(payloads)}]}}'
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/receipts/{receipt_id}")
-def get_receipt(receipt_id: str, state: ServerState = Depends(get_state)) -> dict[str, Any]:
-    receipt = state.storage.get_receipt(receipt_id)
-    if not receipt:
+def get_receipt(receipt_id: str, state: ServerState = Depends(get_state)) -> Response:
+    payload = state.storage.get_receipt_payload(receipt_id)
+    if payload is None:
         raise HTTPException(status_code=404, detail="receipt not found")
-    return receipt
+    return Response(content=payload, media_type="application/json")
 
 
 @router.post("/anchor")
@@ -273,7 +306,7 @@ def anchor_receipts(payload: AnchorRequest, state: ServerState = Depends(get_sta
 
     receipt_hashes = [r["receiptHash"] for r in receipts]
     receipt_ids = [r["receiptId"] for r in receipts]
-    root_hash = compute_anchor_root(receipt_hashes)
+    root_hash = cached_anchor_root(payload.agreementId, receipt_hashes)
     existing_anchor = state.storage.get_anchor(payload.agreementId)
 
     if existing_anchor:
@@ -39,6 +39,10 @@ def create_app() -> FastAPI:
     app.state.server_state = ServerState(storage=storage, escrow=escrow, bundle_store=bundle_store)
     app.include_router(router)
 
+    @app.on_event("shutdown")
+    def shutdown() -> None:
+        storage.close()
+
     @app.get("/health")
     def health() -> dict[str, object]:
         sanity = app.state.server_state.escrow.contract_sanity()
@@ -2,17 +2,128 @@ from __future__ import annotations
 
 import json
 import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from itertools import product
 from pathlib import Path
 from typing import Any
 
+# Stay well under SQLite's bound-parameter limit for IN (...) lookups.
+_IN_CHUNK = 500
+
+
+def _list_receipts_sql(by_agreement: bool, by_actor: bool, after: bool, limited: bool) -> str:
+    where = [
+        clause
+        for clause, enabled in (
+            ("agreement_id = ?", by_agreement),
+            ("actor_id = ?", by_actor),
+            ("sequence > ?", after),
+        )
+        if enabled
+    ]
+    query = "SELECT payload_json FROM receipts"
+    if where:
+        query += " WHERE " + " AND ".join(where)
+    query += " ORDER BY sequence ASC"
+    if limited:
+        query += " LIMIT ?"
+    return query
+
+
+# list_receipt_payloads query keyed by which of (agreement, actor, after sequence, limit)
+# are set; fixed SQL text per combination so sqlite3's statement cache always hits.
+_LIST_RECEIPTS_SQL = {
+    flags: _list_receipts_sql(*flags) for flags in product((False, True), repeat=4)
+}
+
+
+def _chunks(values: list[str]) -> list[list[str]]:
+    return [values[i : i + _IN_CHUNK] for i in range(0, len(values), _IN_CHUNK)]
+
+
+def _anchor_from_row(agreement_id: str, row: sqlite3.Row) -> dict[str, Any]:
+    metadata = json.loads(row["metadata_json"] or "{}")
+    return {
+        "agreementId": agreement_id,
+        "rootHash": row["root_hash"],
+        "txHash": row["tx_hash"] or None,
+        "anchorMode": metadata.get(
+            "anchorMode", "onchain" if row["tx_hash"] else "offchain_bundle"
+        ),
+        "bundleCid": metadata.get("bundleCid"),
+        "bundleHash": metadata.get("bundleHash"),
+        "bundleUri": metadata.get("bundleUri"),
+        "pinMode": metadata.get("pinMode"),
+        "receiptIds": json.loads(row["receipt_ids_json"]),
+    }
+
 
 class EvidenceStorage:
     def __init__(self, db_path: str) -> None:
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
-        self.conn = sqlite3.connect(db_path, check_same_thread=False)
-        self.conn.row_factory = sqlite3.Row
+        self.db_path = db_path
+        # Routes are sync handlers run on FastAPI's threadpool. One connection per worker
+        # thread lets WAL readers proceed in parallel instead of queueing on a shared handle.
+        self._local = threading.local()
+        # Every connection opened by any thread, so close() can release them all.
+        self._conns: list[sqlite3.Connection] = []
+        self._conns_lock = threading.Lock()
         self._init_db()
 
+    @property
+    def conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # Used only by the opening thread; check_same_thread is off so close() can
+            # release it from whichever thread shuts the app down.
+            conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            # Per-connection settings; journal_mode=WAL is persisted by _init_db. NORMAL
+            # only syncs at WAL checkpoints, which WAL mode keeps crash-consistent.
+            conn.executescript(
+                """
+                PRAGMA synchronous=NORMAL;
+                PRAGMA cache_size=-32000;
+                PRAGMA temp_store=MEMORY;
+                PRAGMA mmap_size=268435456;
+                """
+            )
+            with self._conns_lock:
+                self._conns.append(conn)
+            self._local.conn = conn
+        return conn
+
+    def close(self) -> None:
+        """Close every thread's connection; later calls on this storage reconnect lazily."""
+        with self._conns_lock:
+            conns, self._conns = self._conns, []
+            self._local = threading.local()
+        for conn in conns:
+            conn.close()
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Group this thread's writes into a single transaction.
+
+        Commits when the block exits cleanly; any exception rolls back every write in it.
+        """
+        self._local.batching = True
+        try:
+            yield
+        except BaseException:
+            self.conn.rollback()
+            raise
+        else:
+            self.conn.commit()
+        finally:
+            self._local.batching = False
+
+    def _commit(self) -> None:
+        if not getattr(self._local, "batching", False):
+            self.conn.commit()
+
     def _init_db(self) -> None:
         self.conn.executescript(
             """
@@ -94,15 +205,18 @@ class EvidenceStorage:
                 json.dumps(clause, separators=(",", ":")),
             ),
         )
-        self.conn.commit()
+        self._commit()
 
     def get_clause_by_agreement(self, agreement_id: str) -> dict[str, Any] | None:
+        payload = self.get_clause_payload(agreement_id)
+        return json.loads(payload) if payload is not None else None
+
+    def get_clause_payload(self, agreement_id: str) -> str | None:
+        """The stored clause JSON document, undecoded."""
         row = self.conn.execute(
             "SELECT payload_json FROM clauses WHERE agreement_id = ?", (agreement_id,)
         ).fetchone()
-        if not row:
-            return None
-        return json.loads(row["payload_json"])
+        return row["payload_json"] if row else None
 
     def list_clauses(self, limit: int = 200) -> list[dict[str, Any]]:
         rows = self.conn.execute(
@@ -139,15 +253,18 @@ class EvidenceStorage:
                 json.dumps(receipt, separators=(",", ":")),
             ),
         )
-        self.conn.commit()
+        self._commit()
 
     def get_receipt(self, receipt_id: str) -> dict[str, Any] | None:
+        payload = self.get_receipt_payload(receipt_id)
+        return json.loads(payload) if payload is not None else None
+
+    def get_receipt_payload(self, receipt_id: str) -> str | None:
+        """The stored receipt JSON document, undecoded."""
         row = self.conn.execute(
             "SELECT payload_json FROM receipts WHERE receipt_id = ?", (receipt_id,)
         ).fetchone()
-        if not row:
-            return None
-        return json.loads(row["payload_json"])
+        return row["payload_json"] if row else None
 
     def get_receipt_by_sequence(self, agreement_id: str, sequence: int) -> dict[str, Any] | None:
         row = self.conn.execute(
@@ -166,23 +283,48 @@ class EvidenceStorage:
     def list_receipts(
         self, agreement_id: str | None = None, actor_id: str | None = None
     ) -> list[dict[str, Any]]:
-        query = "SELECT payload_json FROM receipts"
-        args: list[Any] = []
-        where: list[str] = []
+        payloads = self.list_receipt_payloads(agreement_id, actor_id)
+        return [json.loads(payload) for payload in payloads]
 
-        if agreement_id:
-            where.append("agreement_id = ?")
-            args.append(agreement_id)
-        if actor_id:
-            where.append("actor_id = ?")
-            args.append(actor_id)
+    def list_receipt_payloads(
+        self,
+        agreement_id: str | None = None,
+        actor_id: str | None = None,
+        *,
+        after_sequence: int | None = None,
+        limit: int | None = None,
+    ) -> list[str]:
+        """Stored receipt JSON documents, undecoded, in sequence order.
 
-        if where:
-            query += " WHERE " + " AND ".join(where)
-        query += " ORDER BY sequence ASC"
+        `after_sequence` and `limit` page through an agreement's chain on the
+        (agreement_id, sequence) index.
+        """
+        filters = (agreement_id or None, actor_id or None, after_sequence, limit)
+        query = _LIST_RECEIPTS_SQL[tuple(value is not None for value in filters)]
+        args = tuple(value for value in filters if value is not None)
+        rows = self.conn.execute(query, args).fetchall()
+        return [r["payload_json"] for r in rows]
 
-        rows = self.conn.execute(query, tuple(args)).fetchall()
-        return [json.loads(r["payload_json"]) for r in rows]
+    def list_receipts_for_agreements(
+        self, agreement_ids: list[str]
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Receipts for many agreements in one query per chunk, keyed by agreement id."""
+        grouped: dict[str, list[dict[str, Any]]] = {
+            agreement_id: [] for agreement_id in agreement_ids
+        }
+        for chunk in _chunks(agreement_ids):
+            rows = self.conn.execute(
+                f"""
+                SELECT agreement_id, payload_json
+                FROM receipts
+                WHERE agreement_id IN ({",".join("?" * len(chunk))})
+                ORDER BY agreement_id, sequence ASC
+                """,
+                tuple(chunk),
+            ).fetchall()
+            for row in rows:
+                grouped[row["agreement_id"]].append(json.loads(row["payload_json"]))
+        return grouped
 
     def get_last_receipt(self, agreement_id: str) -> dict[str, Any] | None:
         row = self.conn.execute(
@@ -219,7 +361,7 @@ class EvidenceStorage:
                 json.dumps(receipt_ids, separators=(",", ":")),
             ),
         )
-        self.conn.commit()
+        self._commit()
 
     def get_anchor(self, agreement_id: str) -> dict[str, Any] | None:
         row = self.conn.execute(
@@ -228,18 +370,25 @@ class EvidenceStorage:
         ).fetchone()
         if not row:
             return None
-        metadata = json.loads(row["metadata_json"] or "{}")
-        return {
-            "agreementId": agreement_id,
-            "rootHash": row["root_hash"],
-            "txHash": row["tx_hash"] or None,
-            "anchorMode": metadata.get("anchorMode", "onchain" if row["tx_hash"] else "offchain_bundle"),
-            "bundleCid": metadata.get("bundleCid"),
-            "bundleHash": metadata.get("bundleHash"),
-            "bundleUri": metadata.get("bundleUri"),
-            "pinMode": metadata.get("pinMode"),
-            "receiptIds": json.loads(row["receipt_ids_json"]),
-        }
+        return _anchor_from_row(agreement_id, row)
+
+    def list_anchors_for_agreements(
+        self, agreement_ids: list[str]
+    ) -> dict[str, dict[str, Any]]:
+        """Anchors for many agreements, keyed by agreement id (unanchored ids are absent)."""
+        anchors: dict[str, dict[str, Any]] = {}
+        for chunk in _chunks(agreement_ids):
+            rows = self.conn.execute(
+                f"""
+                SELECT agreement_id, root_hash, tx_hash, metadata_json, receipt_ids_json
+                FROM anchors
+                WHERE agreement_id IN ({",".join("?" * len(chunk))})
+                """,
+                tuple(chunk),
+            ).fetchall()
+            for row in rows:
+                anchors[row["agreement_id"]] = _anchor_from_row(row["agreement_id"], row)
+        return anchors
 
     def get_anchor_by_root(self, root_hash: str) -> dict[str, Any] | None:
         row = self.conn.execute(
@@ -10,6 +10,7 @@ from verdict_protocol import compute_clause_hash, compute_receipt_hash, hash_can
 def _set_test_env(td: str) -> None:
     os.environ["SQLITE_PATH"] = f"{td}/ev.db"
     os.environ["ESCROW_DRY_RUN"] = "1"
+    os.environ["ESCROW_MOCK_DB_PATH"] = f"{td}/escrow_mock.db"
     os.environ["ESCROW_CONTRACT_ADDRESS"] = "0x" + "1" * 40
     os.environ["IPFS_LOCAL_STORE_PATH"] = f"{td}/ipfs"
 
@@ -72,6 +73,34 @@ def _make_receipt(
     return receipt
 
 
+def _receipt_pair(
+    client: TestClient, agreement_id: str, *, prev_hash: str | None = None
+) -> tuple[dict[str, object], dict[str, object], list]:
+    """Register a clause and build (unposted) request/response receipts chained under it."""
+    account_a = Account.create()
+    account_b = Account.create()
+    clause = _make_clause(agreement_id)
+    assert client.post("/clauses", json=clause).status_code == 200
+
+    first = _make_receipt(
+        account_a=account_a,
+        account_b=account_b,
+        agreement_id=agreement_id,
+        clause_hash=clause["clauseHash"],
+        sequence=0,
+    )
+    second = _make_receipt(
+        account_a=account_b,
+        account_b=account_a,
+        agreement_id=agreement_id,
+        clause_hash=clause["clauseHash"],
+        sequence=1,
+        event_type="response",
+        prev_hash=prev_hash or first["receiptHash"],
+    )
+    return first, second, [account_a, account_b]
+
+
 def test_receipt_ingest_and_anchor() -> None:
     with tempfile.TemporaryDirectory() as td:
         _set_test_env(td)
@@ -98,6 +127,11 @@ def test_receipt_ingest_and_anchor() -> None:
         )
 
         assert client.post("/receipts", json=receipt).status_code == 200
+        fetched = client.get(f"/receipts/{receipt['receiptId']}")
+        assert fetched.headers["content-type"] == "application/json"
+        assert fetched.json()["receiptHash"] == receipt["receiptHash"]
+        assert client.get(f"/clauses/{agreement_id}").json()["clauseHash"] == clause["clauseHash"]
+        assert client.get("/receipts/missing").status_code == 404
 
         anchor_resp = client.post("/anchor", json={"agreementId": agreement_id})
         assert anchor_resp.status_code == 200
@@ -147,6 +181,119 @@ def test_agreement_export_returns_complete_bundle() -> None:
         assert payload["integrity"]["rootAnchored"] is True
 
 
+def test_bulk_receipt_post_ingests_chain_in_order() -> None:
+    with tempfile.TemporaryDirectory() as td:
+        _set_test_env(td)
+
+        from evidence_service.server import create_app
+
+        app = create_app()
+        client = TestClient(app)
+
+        agreement_id = str(uuid.uuid4())
+        first, second, _ = _receipt_pair(client, agreement_id)
+
+        resp = client.post("/receipts:bulk", json={"receipts": [first, second]})
+        assert resp.status_code == 200
+        assert resp.json()["count"] == 2
+        assert [item["receiptId"] for item in resp.json()["items"]] == [
+            first["receiptId"],
+            second["receiptId"],
+        ]
+
+        receipts = client.get("/receipts", params={"agreementId": agreement_id}).json()["items"]
+        assert [r["receiptId"] for r in receipts] == [first["receiptId"], second["receiptId"]]
+
+        page = client.get("/receipts", params={"agreementId": agreement_id, "limit": 1}).json()
+        assert [r["receiptId"] for r in page["items"]] == [first["receiptId"]]
+        page = client.get(
+            "/receipts", params={"agreementId": agreement_id, "afterSequence": 0, "limit": 1}
+        ).json()
+        assert page["count"] == 1
+        assert [r["receiptId"] for r in page["items"]] == [second["receiptId"]]
+
+
+def test_receipt_paging_stays_within_one_agreement() -> None:
+    with tempfile.TemporaryDirectory() as td:
+        _set_test_env(td)
+
+        from evidence_service.server import create_app
+
+        app = create_app()
+        client = TestClient(app)
+
+        chains = {}
+        for agreement_id in (str(uuid.uuid4()), str(uuid.uuid4())):
+            first, second, _ = _receipt_pair(client, agreement_id)
+            resp = client.post("/receipts:bulk", json={"receipts": [first, second]})
+            assert resp.status_code == 200
+            chains[agreement_id] = [first["receiptId"], second["receiptId"]]
+
+        for agreement_id, receipt_ids in chains.items():
+            seen, after = [], None
+            while True:
+                params = {"agreementId": agreement_id, "limit": 1}
+                if after is not None:
+                    params["afterSequence"] = after
+                items = client.get("/receipts", params=params).json()["items"]
+                if not items:
+                    break
+                seen += [r["receiptId"] for r in items]
+                after = items[-1]["sequence"]
+            assert seen == receipt_ids
+
+        assert client.get("/receipts", params={"afterSequence": 0}).status_code == 400
+        assert client.get("/receipts", params={"limit": 2001}).status_code == 422
+
+
+def test_bulk_receipt_post_rolls_back_on_rejection() -> None:
+    with tempfile.TemporaryDirectory() as td:
+        _set_test_env(td)
+
+        from evidence_service.server import create_app
+
+        app = create_app()
+        client = TestClient(app)
+
+        agreement_id = str(uuid.uuid4())
+        first, broken, _ = _receipt_pair(client, agreement_id, prev_hash="0x" + "00" * 32)
+
+        resp = client.post("/receipts:bulk", json={"receipts": [first, broken]})
+        assert resp.status_code == 400
+
+        receipts = client.get("/receipts", params={"agreementId": agreement_id}).json()
+        assert receipts["count"] == 0
+
+
+def test_list_agreements_summarizes_receipts_and_anchors() -> None:
+    with tempfile.TemporaryDirectory() as td:
+        _set_test_env(td)
+
+        from evidence_service.server import create_app
+
+        app = create_app()
+        client = TestClient(app)
+
+        anchored_id = str(uuid.uuid4())
+        empty_id = str(uuid.uuid4())
+        first, second, accounts = _receipt_pair(client, anchored_id)
+        assert client.post("/clauses", json=_make_clause(empty_id)).status_code == 200
+        assert client.post("/receipts:bulk", json={"receipts": [first, second]}).status_code == 200
+        assert client.post("/anchor", json={"agreementId": anchored_id}).status_code == 200
+
+        items = {item["agreementId"]: item for item in client.get("/agreements").json()["items"]}
+        assert items[anchored_id]["receiptCount"] == 2
+        assert items[anchored_id]["requestCount"] == 1
+        assert items[anchored_id]["responseCount"] == 1
+        assert items[anchored_id]["actors"] == sorted(
+            f"did:8004:{account.address}" for account in accounts
+        )
+        assert items[anchored_id]["anchor"]["rootHash"].startswith("0x")
+        assert items[empty_id]["receiptCount"] == 0
+        assert items[empty_id]["actors"] == []
+        assert items[empty_id]["anchor"] is None
+
+
 def test_receipt_post_is_idempotent_for_same_logical_receipt() -> None:
     with tempfile.TemporaryDirectory() as td:
         _set_test_env(td)
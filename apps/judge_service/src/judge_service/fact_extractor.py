@@ -3,35 +3,63 @@ from __future__ import annotations
 from collections import defaultdict
 from typing import Any
 
+# (rule list, metric, operator) -> (fact compared against the threshold, reason code).
+# Rules with any other metric/operator pair are parsed but never fire.
+_RULE_CHECKS = {
+    ("slaRules", "latency_ms", "<="): ("latency_ms", "sla_breach:latency"),
+    ("abuseRules", "requests_per_minute", "<="): (
+        "peak_requests_per_minute",
+        "clause_violated:rate_limit",
+    ),
+}
+
+_CompiledRules = tuple[tuple[str, float, str], ...]
+
+
+def _compile_rules(clause: dict[str, Any]) -> _CompiledRules:
+    """Reduce a clause's SLA and abuse rules to (fact, threshold, reason code) checks.
+
+    Run per call rather than cached by clauseHash: the judge never recomputes the hash of
+    the clause it is handed, so the hash alone cannot vouch for the rules.
+    """
+    checks: list[tuple[str, float, str]] = []
+    for rule_list in ("slaRules", "abuseRules"):
+        for rule in clause.get(rule_list, []):
+            value = float(rule.get("value"))
+            check = _RULE_CHECKS.get((rule_list, rule.get("metric"), rule.get("operator")))
+            if check:
+                checks.append((check[0], value, check[1]))
+    return tuple(checks)
+
 
 def extract_facts(clause: dict[str, Any], receipts: list[dict[str, Any]]) -> tuple[dict[str, Any], list[str], str | None]:
     request_times: dict[str, int] = {}
     response_times: dict[str, int] = {}
+    by_minute: defaultdict[int, int] = defaultdict(int)
     response_format_ok = True
 
+    # One pass over the receipts; later receipts for the same requestId win, as before.
     for receipt in receipts:
-        if receipt["eventType"] == "request":
-            request_times[receipt["requestId"]] = receipt["timestamp"]
-        if receipt["eventType"] == "response":
+        event_type = receipt["eventType"]
+        if event_type == "request":
+            ts = receipt["timestamp"]
+            request_times[receipt["requestId"]] = ts
+            by_minute[ts // 60000] += 1
+        elif event_type == "response":
             response_times[receipt["requestId"]] = receipt["timestamp"]
-            result_value = (receipt.get("metadata") or {}).get("result_type")
-            if result_value == "bad_format":
+            if (receipt.get("metadata") or {}).get("result_type") == "bad_format":
                 response_format_ok = False
 
-    latencies: list[int] = []
-    for req_id, req_ts in request_times.items():
-        if req_id in response_times:
-            latencies.append(max(0, response_times[req_id] - req_ts))
-
-    max_latency = max(latencies) if latencies else 0
-
-    by_minute: defaultdict[int, int] = defaultdict(int)
-    for receipt in receipts:
-        if receipt["eventType"] == "request":
-            minute_bucket = receipt["timestamp"] // 60000
-            by_minute[minute_bucket] += 1
-
-    peak_rpm = max(by_minute.values()) if by_minute else 0
+    # Pairing happens after the scan so a response logged before its request still counts.
+    max_latency = max(
+        (
+            max(0, response_times[req_id] - req_ts)
+            for req_id, req_ts in request_times.items()
+            if req_id in response_times
+        ),
+        default=0,
+    )
+    peak_rpm = max(by_minute.values(), default=0)
 
     facts = {
         "latency_ms": max_latency,
@@ -41,23 +69,9 @@ def extract_facts(clause: dict[str, Any], receipts: list[dict[str, Any]]) -> tup
         "response_count": len(response_times),
     }
 
-    reason_codes: list[str] = []
-
-    for rule in clause.get("slaRules", []):
-        metric = rule.get("metric")
-        op = rule.get("operator")
-        value = float(rule.get("value"))
-
-        if metric == "latency_ms" and op == "<=" and max_latency > value:
-            reason_codes.append("sla_breach:latency")
-
-    for rule in clause.get("abuseRules", []):
-        metric = rule.get("metric")
-        op = rule.get("operator")
-        value = float(rule.get("value"))
-
-        if metric == "requests_per_minute" and op == "<=" and peak_rpm > value:
-            reason_codes.append("clause_violated:rate_limit")
+    reason_codes = [
+        code for fact, threshold, code in _compile_rules(clause) if facts[fact] > threshold
+    ]
 
     winner: str | None = None
     if reason_codes:
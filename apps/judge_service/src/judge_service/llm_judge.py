@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 import os
 import re
+import threading
 from typing import Any
 
 # Tiered court system: escalating models and fees
@@ -13,9 +14,15 @@ COURT_TIERS = [
 ]
 
 
+_USER_CONTENT_TAG = re.compile(r'<\s*/?\s*user-content[^>]*>', re.IGNORECASE)
+_ROLE_PREFIX = re.compile(r'^(system|assistant|user)\s*:', re.MULTILINE | re.IGNORECASE)
+_JSON_FENCE = re.compile(r'```(?:json)?\s*\n?({.*?})\s*\n?```', re.DOTALL)
+_WINNER_OBJECT = re.compile(r'\{[^{}]*"winner"[^{}]*\}')
+
+
 def _sanitize_user_text(text: str) -> str:
-    text = re.sub(r'<\s*/?\s*user-content[^>]*>', '[tag-stripped]', text, flags=re.IGNORECASE)
-    text = re.sub(r'^(system|assistant|user)\s*:', r'[\1]:', text, flags=re.MULTILINE | re.IGNORECASE)
+    text = _USER_CONTENT_TAG.sub('[tag-stripped]', text)
+    text = _ROLE_PREFIX.sub(r'[\1]:', text)
     return text.strip()
 
 
@@ -81,6 +88,25 @@ After your opinion, include a JSON block:
 class LLMJudge:
     def __init__(self) -> None:
         self.api_key = os.environ.get("LLM_API_KEY") or os.environ.get("ANTHROPIC_API_KEY", "")
+        self._client: Any = None
+        self._client_lock = threading.Lock()
+
+    def _get_client(self) -> Any:
+        # One client per judge so disputes reuse its keep-alive connection pool instead of
+        # paying a fresh TLS handshake each time. Built lazily: anthropic is only imported
+        # once a ruling actually needs the model.
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    from anthropic import Anthropic
+
+                    self._client = Anthropic(api_key=self.api_key)
+        return self._client
+
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+            self._client = None
 
     def judge(
         self,
@@ -115,9 +141,7 @@ class LLMJudge:
             )
 
         try:
-            from anthropic import Anthropic
-
-            client = Anthropic(api_key=self.api_key)
+            client = self._get_client()
 
             user_content = json.dumps({
                 "clause": clause,
@@ -137,12 +161,12 @@ class LLMJudge:
             )
 
             # Extract JSON from response
-            json_match = re.search(r'```(?:json)?\s*\n?({.*?})\s*\n?```', text, re.DOTALL)
+            json_match = _JSON_FENCE.search(text)
             if json_match:
                 payload = json.loads(json_match.group(1))
             else:
                 # Try finding raw JSON object
-                for m in re.finditer(r'\{[^{}]*"winner"[^{}]*\}', text):
+                for m in _WINNER_OBJECT.finditer(text):
                     try:
                         payload = json.loads(m.group())
                         break
@@ -151,6 +151,9 @@ def create_app() -> FastAPI:
             task.cancel()
             with contextlib.suppress(asyncio.CancelledError):
                 await task
+        close_llm = getattr(app.state.judge_state.llm, "close", None)
+        if close_llm:
+            close_llm()
 
     @app.get("/health")
     def health() -> dict[str, Any]:
@@ -371,7 +374,10 @@ async def _handle_dispute(state: JudgeState, event: DisputeEvent) -> None:
         elif logical_winner == "defendant":
             winner = defendant
         else:
-            llm_codes, llm_winner, llm_confidence, full_opinion = state.llm.judge(
+            # The model call is blocking network I/O; keep it off the event loop so the
+            # watcher and HTTP routes stay responsive while a ruling is drafted.
+            llm_codes, llm_winner, llm_confidence, full_opinion = await asyncio.to_thread(
+                state.llm.judge,
                 clause=clause,
                 facts=facts,
                 evidence_summary={"receiptCount": len(receipts), "reasonCodes": reason_codes},
@@ -56,6 +56,7 @@ async def test_judge_pipeline_deterministic_submission(monkeypatch):
         os.environ["GOAT_CHAIN_ID"] = "48816"
         os.environ["ESCROW_CONTRACT_ADDRESS"] = "0x" + "1" * 40
         os.environ["ESCROW_DRY_RUN"] = "1"
+        os.environ["ESCROW_MOCK_DB_PATH"] = f"{td}/escrow_mock.db"
 
         judge_key = Account.create().key.hex()
         os.environ["JUDGE_PRIVATE_KEY"] = judge_key
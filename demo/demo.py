@@ -12,9 +12,11 @@ Requires: USDC funded in judge wallet, contract deployed.
 """
 
 import asyncio
+import atexit
 import hashlib
 import json
 import os
+import pickle
 import signal
 import subprocess
 import sys
@@ -22,9 +24,13 @@ import time
 from pathlib import Path
 
 import httpx
+import requests
 from dotenv import load_dotenv
 from eth_account import Account
+from eth_utils import function_signature_to_4byte_selector, keccak
+from requests.adapters import HTTPAdapter
 from web3 import Web3
+from web3.datastructures import AttributeDict
 
 load_dotenv(Path.home() / ".agent-court" / ".env")
 
@@ -32,7 +38,13 @@ RPC = os.environ["GOAT_RPC_URL"]
 CHAIN_ID = int(os.environ["CHAIN_ID"])
 JUDGE_KEY = os.environ["JUDGE_PRIVATE_KEY"]
 
-w3 = Web3(Web3.HTTPProvider(RPC))
+# One pooled session for every RPC call so the run pays for a single TCP+TLS handshake.
+_rpc_session = requests.Session()
+_rpc_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+_rpc_session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+atexit.register(_rpc_session.close)
+
+w3 = Web3(Web3.HTTPProvider(RPC, session=_rpc_session, request_kwargs={"timeout": 30}))
 judge_acct = Account.from_key(JUDGE_KEY)
 
 # Persistent demo agent wallets
@@ -44,9 +56,28 @@ CONTRACT_FILE = Path.home() / ".agent-court" / "contract_address.txt"
 CONTRACT_ADDR = os.environ.get("CONTRACT_ADDRESS", "")
 if not CONTRACT_ADDR and CONTRACT_FILE.exists():
     CONTRACT_ADDR = CONTRACT_FILE.read_text().strip()
+CONTRACT_CHECKSUM = Web3.to_checksum_address(CONTRACT_ADDR) if CONTRACT_ADDR else ""
 
 _abi_file = Path.home() / ".agent-court" / "abi.json"
-ABI = json.loads(_abi_file.read_text())
+
+
+def _load_abi(path):
+    """Load the contract ABI, reusing a pickle sidecar while it is newer than the JSON."""
+    cache = path.with_name(path.name + ".pkl")
+    try:
+        if cache.stat().st_mtime >= path.stat().st_mtime:
+            return pickle.loads(cache.read_bytes())
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+    abi = json.loads(path.read_bytes())
+    try:
+        cache.write_bytes(pickle.dumps(abi, protocol=pickle.HIGHEST_PROTOCOL))
+    except OSError:
+        pass
+    return abi
+
+
+ABI = _load_abi(_abi_file)
 
 # USDC on GOAT testnet3 (6 decimals)
 USDC_ADDRESS = "0x29d1ee93e9ecf6e50f309f498e40a6b42d352fa1"
@@ -59,26 +90,169 @@ IDENTITY_ABI = json.loads("""[
     {"inputs":[{"internalType":"address","name":"owner","type":"address"}],"name":"balanceOf","outputs":[{"internalType":"uint256","name":"","type":"uint256"}],"stateMutability":"view","type":"function"}
 ]""")
 
+RULE = "=" * 60
+
 # Judge server
 JUDGE_SERVER = "http://localhost:8402"
 
+# Some RPC providers bill per call and slow down on large batches, so keep them small.
+BATCH_LIMIT = 10
 
-def send_tx(acct, fn, value=0):
-    """Build, sign, send a transaction."""
-    tx = fn.build_transaction({
+
+# Gas price barely moves over a demo run, so refresh it at most every GAS_PRICE_TTL seconds.
+GAS_PRICE_TTL = 30
+_gas_price_cache = (None, 0.0)
+
+
+def gas_price():
+    """Return the cached gas price, re-querying the node once it is older than the TTL."""
+    global _gas_price_cache
+    now = time.time()
+    if _gas_price_cache[0] is None or now - _gas_price_cache[1] > GAS_PRICE_TTL:
+        _gas_price_cache = (w3.eth.gas_price, now)
+    return _gas_price_cache[0]
+
+
+# Nonces are tracked locally after the first fetch so one signer can pipeline txs.
+_nonces = {}
+
+
+def next_nonce(acct):
+    """Return the next nonce for `acct`, fetching from the chain only once."""
+    if acct.address not in _nonces:
+        _nonces[acct.address] = w3.eth.get_transaction_count(acct.address)
+    nonce = _nonces[acct.address]
+    _nonces[acct.address] += 1
+    return nonce
+
+
+def broadcast(acct, tx):
+    """Sign and broadcast a prepared transaction dict; returns the tx hash."""
+    signed = acct.sign_transaction(tx)
+    return w3.eth.send_raw_transaction(signed.raw_transaction)
+
+
+def send_tx_async(acct, fn, value=0):
+    """Build, sign, send a transaction without waiting for it to be mined.
+
+    The tx dict is assembled locally (gas is fixed, nonce and gas price are cached),
+    so nothing but eth_sendRawTransaction goes over the wire.
+    """
+    tx = {
         "from": acct.address,
-        "nonce": w3.eth.get_transaction_count(acct.address),
+        "to": fn.address,
+        "data": fn._encode_transaction_data(),
+        "nonce": next_nonce(acct),
         "chainId": CHAIN_ID,
         "gas": 500000,
-        "gasPrice": w3.eth.gas_price,
+        "gasPrice": gas_price(),
         "value": value,
-    })
-    signed = acct.sign_transaction(tx)
-    tx_hash = w3.eth.send_raw_transaction(signed.raw_transaction)
-    receipt = w3.eth.wait_for_transaction_receipt(tx_hash, timeout=60)
-    status = "OK" if receipt.status == 1 else "FAILED"
-    print(f"  TX {tx_hash.hex()[:16]}... [{status}] gas={receipt.gasUsed}")
-    return receipt
+    }
+    return broadcast(acct, tx)
+
+
+def wait_receipts(tx_hashes, timeout=60):
+    """Wait for all tx_hashes, polling every pending receipt in one batched request."""
+    receipts = {}
+    deadline = time.time() + timeout
+    delay = 0.1
+    while True:
+        pending = [tx_hash for tx_hash in tx_hashes if tx_hash not in receipts]
+        if not pending:
+            break
+        responses = w3.provider.make_batch_request(
+            [("eth_getTransactionReceipt", [Web3.to_hex(tx_hash)]) for tx_hash in pending]
+        )
+        if not isinstance(responses, list):
+            raise RuntimeError(f"receipt batch failed: {responses.get('error')}")
+        for tx_hash, response in zip(pending, responses, strict=True):
+            raw = response.get("result")
+            if raw:
+                receipts[tx_hash] = AttributeDict({
+                    "transactionHash": tx_hash,
+                    "blockNumber": int(raw["blockNumber"], 16),
+                    "gasUsed": int(raw["gasUsed"], 16),
+                    "status": int(raw["status"], 16),
+                    "logs": raw.get("logs") or [],
+                })
+        if len(receipts) == len(tx_hashes):
+            break
+        if time.time() > deadline:
+            missing = len(tx_hashes) - len(receipts)
+            raise TimeoutError(f"{missing} transaction(s) not mined after {timeout}s")
+        time.sleep(delay)
+        delay = min(delay * 2, 0.5)
+
+    for tx_hash in tx_hashes:
+        receipt = receipts[tx_hash]
+        status = "OK" if receipt.status == 1 else "FAILED"
+        print(f"  TX {tx_hash.hex()[:16]}... [{status}] gas={receipt.gasUsed}")
+    return [receipts[tx_hash] for tx_hash in tx_hashes]
+
+
+def send_tx(acct, fn, value=0):
+    """Build, sign, send a transaction and wait for it to be mined."""
+    return wait_receipts([send_tx_async(acct, fn, value)])[0]
+
+
+class RawUintCall:
+    """Pre-encoded eth_call to the court contract that returns a single uint256.
+
+    Used for the hot getters so reads skip web3's per-call ABI lookup and encoding.
+    """
+
+    __slots__ = ("data",)
+
+    def __init__(self, data):
+        self.data = data
+
+    def __call__(self):
+        return w3.eth.call({"to": CONTRACT_CHECKSUM, "data": self.data})
+
+
+_BALANCES_SELECTOR = function_signature_to_4byte_selector("balances(address)")
+
+TX_CREATED_EVENT = "TransactionCreated(uint256,uint256,address,uint256)"
+
+
+def created_id(receipt, event_signature):
+    """Return the id a create call assigned, read from the court event in its receipt.
+
+    The court is shared on testnet, so counters read beforehand can be taken by other
+    senders; the event's first indexed topic is the id this transaction actually got.
+    """
+    topic0 = "0x" + keccak(text=event_signature).hex()
+    contract = CONTRACT_CHECKSUM.lower()
+    for log in receipt.logs:
+        topics = log.get("topics") or []
+        if log.get("address", "").lower() == contract and topics and topics[0].lower() == topic0:
+            return int(topics[1], 16)
+    raise RuntimeError(f"{event_signature} not emitted by tx {receipt.transactionHash.hex()}")
+
+
+def balances_of(addr):
+    """Raw `balances(address)` read; the address is left-padded to one ABI word."""
+    return RawUintCall(_BALANCES_SELECTOR + bytes.fromhex(addr[2:]).rjust(32, b"\0"))
+
+
+def batch_read(calls):
+    """Run independent read-only calls as JSON-RPC batches (one round-trip per batch).
+
+    Each item is a bound contract function, a RawUintCall, or a zero-arg callable
+    returning a `w3.eth` request, e.g. `lambda: w3.eth.get_balance(addr)`.
+    """
+    results = []
+    for i in range(0, len(calls), BATCH_LIMIT):
+        chunk = calls[i:i + BATCH_LIMIT]
+        with w3.batch_requests() as batch:
+            for call in chunk:
+                batch.add(call if hasattr(call, "call") else call())
+            raw = batch.execute()
+        results.extend(
+            int.from_bytes(result, "big") if isinstance(call, RawUintCall) else result
+            for call, result in zip(chunk, raw, strict=True)
+        )
+    return results
 
 
 def h(data):
@@ -86,6 +260,59 @@ def h(data):
     return hashlib.sha256(json.dumps(data, sort_keys=True).encode()).digest()
 
 
+# hashlib.sha256 is OpenSSL-backed (SHA-NI / ARMv8 crypto extensions) on normal builds;
+# a Python built without _hashlib falls back to the much slower built-in _sha256.
+if getattr(hashlib.sha256, "__module__", "") != "_hashlib":
+    print("WARNING: hashlib.sha256 is not OpenSSL-backed; hashing will be slow", file=sys.stderr)
+
+
+# Byte-exact templates of json.dumps(sort_keys=True) for the fixed-shape payloads
+# hashed in the dispute path, so they skip dict sorting and can nest pre-built bytes.
+_js = json.encoder.encode_basestring_ascii
+_REQUEST_TEMPLATE = '{"city": %s, "timestamp": %d}'
+_EVIDENCE_TEMPLATE = b'{"complaint": %s, "request": %s, "response": %s}'
+
+
+def canon(data):
+    return json.dumps(data, sort_keys=True).encode()
+
+
+def request_canon(city, timestamp):
+    return (_REQUEST_TEMPLATE % (_js(city), timestamp)).encode()
+
+
+def evidence_canon(complaint, request_bytes, response_bytes):
+    return _EVIDENCE_TEMPLATE % (_js(complaint).encode(), request_bytes, response_bytes)
+
+
+def h_bytes(encoded):
+    """Hash already-canonical JSON bytes into bytes32."""
+    return hashlib.sha256(encoded).digest()
+
+
+async def submit_to_judge(dispute_id, plaintiff_arg, defendant_arg, tx_data):
+    """Post both arguments and the tx data concurrently, then ask the judge to rule."""
+    async with httpx.AsyncClient(base_url=JUDGE_SERVER, timeout=10) as client:
+        await asyncio.gather(
+            client.post(
+                "/dispute/argue", json={"dispute_id": dispute_id, "argument": plaintiff_arg}
+            ),
+            client.post(
+                "/dispute/respond", json={"dispute_id": dispute_id, "argument": defendant_arg}
+            ),
+            client.post("/dispute/data", json={"dispute_id": dispute_id, "data": tx_data}),
+        )
+        # The ruling reads everything submitted above, so it has to go last.
+        print("  Calling AI judge...")
+        return await client.post("/rule", json={"dispute_id": dispute_id}, timeout=120)
+
+
+def fmt_usdc(amount):
+    """Format a 6-decimal USDC integer without going through float."""
+    whole, frac = divmod(amount, 1_000_000)
+    return f"{whole}.{frac:06d}"
+
+
 def usdc(amount):
     """Convert USDC amount (float) to 6-decimal integer."""
     return int(amount * 1e6)
@@ -96,13 +323,13 @@ def main():
         print("Deploy the contract first! Set CONTRACT_ADDRESS in ~/.agent-court/.env")
         sys.exit(1)
 
-    contract = w3.eth.contract(address=Web3.to_checksum_address(CONTRACT_ADDR), abi=ABI)
+    contract = w3.eth.contract(address=CONTRACT_CHECKSUM, abi=ABI)
     usdc_token = w3.eth.contract(address=Web3.to_checksum_address(USDC_ADDRESS), abi=USDC_ABI)
     identity = w3.eth.contract(address=Web3.to_checksum_address(IDENTITY_REGISTRY), abi=IDENTITY_ABI)
 
-    print("=" * 60)
+    print(RULE)
     print("AGENT COURT — LIVE DEMO (USDC)")
-    print("=" * 60)
+    print(RULE)
     print(f"Contract:     {CONTRACT_ADDR}")
     print(f"USDC:         {USDC_ADDRESS}")
     print(f"Judge:        {judge_acct.address}")
@@ -110,9 +337,17 @@ def main():
     print(f"Bad Provider: {BAD_PROVIDER.address}")
     print()
 
-    # Check USDC balance of judge
-    judge_usdc = usdc_token.functions.balanceOf(judge_acct.address).call()
-    print(f"Judge USDC balance: {judge_usdc / 1e6}")
+    agents = [("Good Agent", GOOD_AGENT), ("Bad Provider", BAD_PROVIDER)]
+
+    # Check USDC balance of judge (batched with the agents' starting balances)
+    judge_usdc, *agent_bals = batch_read([
+        usdc_token.functions.balanceOf(judge_acct.address),
+        *[call for _, acct in agents for call in (
+            lambda addr=acct.address: w3.eth.get_balance(addr),
+            usdc_token.functions.balanceOf(acct.address),
+        )],
+    ])
+    print(f"Judge USDC balance: {fmt_usdc(judge_usdc)}")
     if judge_usdc < usdc(0.10):
         print("ERROR: Judge needs at least 0.10 USDC to fund demo agents")
         print(f"Send USDC to {judge_acct.address} on GOAT Testnet3")
@@ -123,75 +358,103 @@ def main():
     gas_deposit = Web3.to_wei(0.000005, "ether")
     usdc_per_agent = usdc(0.05)  # 0.05 USDC each (1/10th for testing)
 
-    for name, acct in [("Good Agent", GOOD_AGENT), ("Bad Provider", BAD_PROVIDER)]:
+    # All funding comes from the judge, so send back-to-back and wait once.
+    funding_txs = []
+    for i, (_, acct) in enumerate(agents):
+        bal, agent_usdc = agent_bals[2 * i], agent_bals[2 * i + 1]
         # Gas for tx fees
-        bal = w3.eth.get_balance(acct.address)
         if bal < gas_deposit:
-            tx = {
+            funding_txs.append(broadcast(judge_acct, {
                 "from": judge_acct.address, "to": acct.address,
                 "value": gas_deposit,
-                "nonce": w3.eth.get_transaction_count(judge_acct.address),
-                "chainId": CHAIN_ID, "gas": 21000, "gasPrice": w3.eth.gas_price,
-            }
-            signed = judge_acct.sign_transaction(tx)
-            w3.eth.wait_for_transaction_receipt(w3.eth.send_raw_transaction(signed.raw_transaction))
+                "nonce": next_nonce(judge_acct),
+                "chainId": CHAIN_ID, "gas": 21000, "gasPrice": gas_price(),
+            }))
 
         # USDC
-        agent_usdc = usdc_token.functions.balanceOf(acct.address).call()
         if agent_usdc < usdc_per_agent:
-            send_tx(judge_acct, usdc_token.functions.transfer(acct.address, usdc_per_agent))
-        agent_usdc = usdc_token.functions.balanceOf(acct.address).call()
-        print(f"  {name}: {agent_usdc / 1e6} USDC, {Web3.from_wei(w3.eth.get_balance(acct.address), 'ether')} BTC (gas)")
+            transfer = usdc_token.functions.transfer(acct.address, usdc_per_agent)
+            funding_txs.append(send_tx_async(judge_acct, transfer))
+    wait_receipts(funding_txs)
+
+    funded = batch_read([
+        call for _, acct in agents for call in (
+            usdc_token.functions.balanceOf(acct.address),
+            lambda addr=acct.address: w3.eth.get_balance(addr),
+        )
+    ])
+    for i, (name, _) in enumerate(agents):
+        agent_usdc, gas_bal = funded[2 * i], funded[2 * i + 1]
+        print(f"  {name}: {fmt_usdc(agent_usdc)} USDC, {Web3.from_wei(gas_bal, 'ether')} BTC (gas)")
 
     # [2] ERC-8004 identity registration (skip if already registered)
     print("\n[2] Registering agents with ERC-8004...")
-    for name, acct, uri in [
+    id_counts = batch_read([identity.functions.balanceOf(acct.address) for _, acct in agents])
+    registering = []
+    for (name, acct, uri), has_id in zip([
         ("Good Agent", GOOD_AGENT, "https://agent-court.notruefireman.org/agents/good-agent"),
         ("Bad Provider", BAD_PROVIDER, "https://agent-court.notruefireman.org/agents/bad-provider"),
-    ]:
-        has_id = identity.functions.balanceOf(acct.address).call()
+    ], id_counts, strict=True):
         if has_id > 0:
             print(f"  {name}: already has ERC-8004 identity")
         else:
-            send_tx(acct, identity.functions.register(uri))
-            print(f"  {name}: ERC-8004 identity registered")
+            registering.append((name, send_tx_async(acct, identity.functions.register(uri))))
+    wait_receipts([tx_hash for _, tx_hash in registering])
+    for name, _ in registering:
+        print(f"  {name}: ERC-8004 identity registered")
 
     # [3] Approve USDC + register in AgentCourt (skip if already registered)
     print("\n[3] Registering agents in AgentCourt...")
     deposit_amount = usdc(0.02)  # 0.02 USDC deposit (1/10th for testing)
 
-    for name, acct in [("Good Agent", GOOD_AGENT), ("Bad Provider", BAD_PROVIDER)]:
-        if contract.functions.isRegistered(acct.address).call():
+    reg_state = batch_read([
+        call for _, acct in agents for call in (
+            contract.functions.isRegistered(acct.address),
+            balances_of(acct.address),
+        )
+    ])
+    needs_deposit = []
+    for i, (name, acct) in enumerate(agents):
+        registered, bal = reg_state[2 * i], reg_state[2 * i + 1]
+        if registered:
             print(f"  {name}: already registered")
-            # Top up if low
-            bal = contract.functions.balances(acct.address).call()
-            if bal < usdc(0.01):
-                send_tx(acct, usdc_token.functions.approve(CONTRACT_ADDR, deposit_amount))
-                send_tx(acct, contract.functions.deposit(deposit_amount))
-                print(f"  {name}: topped up {deposit_amount / 1e6} USDC")
-        else:
-            send_tx(acct, usdc_token.functions.approve(CONTRACT_ADDR, deposit_amount))
-            send_tx(acct, contract.functions.register(deposit_amount))
-            print(f"  {name}: registered + deposited {deposit_amount / 1e6} USDC")
+        # Unregistered agents register with a deposit; registered ones top up if low.
+        if not registered or bal < usdc(0.01):
+            needs_deposit.append((name, acct, registered))
+
+    if needs_deposit:
+        # approve + register/deposit are nonce-ordered per agent; both agents run in parallel.
+        reg_txs = []
+        for _, acct, registered in needs_deposit:
+            fund = contract.functions.deposit if registered else contract.functions.register
+            approve = usdc_token.functions.approve(CONTRACT_CHECKSUM, deposit_amount)
+            reg_txs.append(send_tx_async(acct, approve))
+            reg_txs.append(send_tx_async(acct, fund(deposit_amount)))
+        wait_receipts(reg_txs)
+        for name, _, registered in needs_deposit:
+            if registered:
+                print(f"  {name}: topped up {fmt_usdc(deposit_amount)} USDC")
+            else:
+                print(f"  {name}: registered + deposited {fmt_usdc(deposit_amount)} USDC")
 
     # [4] Bad Provider registers a weather service
     print("\n[4] Bad Provider registers weather service...")
     terms = h({"service": "weather", "sla": "accurate data", "price": "0.05 USDC"})
     price = usdc(0.005)    # $0.005 per call (1/10th for testing)
     bond_req = usdc(0.01)  # need at least $0.01 in bond
-    svc_id = contract.functions.serviceCount().call()
-    send_tx(BAD_PROVIDER, contract.functions.registerService(terms, price, bond_req))
+    receipt = send_tx(BAD_PROVIDER, contract.functions.registerService(terms, price, bond_req))
+    svc_id = created_id(receipt, "ServiceRegistered(uint256,address,uint256)")
     print(f"  Service registered: Weather API (ID: {svc_id}, price: $0.05)")
 
     # === HAPPY PATH ===
-    print("\n" + "=" * 60)
+    print("\n" + RULE)
     print("SCENARIO 1: HAPPY PATH")
-    print("=" * 60)
+    print(RULE)
 
     print("\n[5] Good Agent requests weather service...")
-    req_data = {"city": "sf", "timestamp": int(time.time())}
-    tx1_id = contract.functions.transactionCount().call()
-    send_tx(GOOD_AGENT, contract.functions.requestService(svc_id, h(req_data)))
+    req_bytes = request_canon("sf", int(time.time()))
+    receipt = send_tx(GOOD_AGENT, contract.functions.requestService(svc_id, h_bytes(req_bytes)))
+    tx1_id = created_id(receipt, TX_CREATED_EVENT)
     print(f"  Request submitted (TX ID: {tx1_id})")
 
     print("\n[6] Bad Provider fulfills with GOOD data...")
@@ -203,34 +466,39 @@ def main():
     send_tx(GOOD_AGENT, contract.functions.confirmTransaction(tx1_id))
     print("  Transaction completed! Provider paid.")
 
-    good_bal = contract.functions.balances(GOOD_AGENT.address).call()
-    bad_bal = contract.functions.balances(BAD_PROVIDER.address).call()
-    print(f"\n  Good Agent balance: {good_bal / 1e6} USDC")
-    print(f"  Bad Provider balance: {bad_bal / 1e6} USDC")
+    good_bal, bad_bal = batch_read([
+        balances_of(GOOD_AGENT.address),
+        balances_of(BAD_PROVIDER.address),
+    ])
+    print(f"\n  Good Agent balance: {fmt_usdc(good_bal)} USDC")
+    print(f"  Bad Provider balance: {fmt_usdc(bad_bal)} USDC")
 
     # === DISPUTE PATH ===
-    print("\n" + "=" * 60)
+    print("\n" + RULE)
     print("SCENARIO 2: BAD DATA → DISPUTE → AI JUDGE")
-    print("=" * 60)
+    print(RULE)
 
     print("\n[8] Good Agent requests weather again...")
     req_data2 = {"city": "sf", "timestamp": int(time.time())}
-    tx2_id = contract.functions.transactionCount().call()
-    send_tx(GOOD_AGENT, contract.functions.requestService(svc_id, h(req_data2)))
+    req2_bytes = request_canon(req_data2["city"], req_data2["timestamp"])
+    receipt = send_tx(GOOD_AGENT, contract.functions.requestService(svc_id, h_bytes(req2_bytes)))
+    tx2_id = created_id(receipt, TX_CREATED_EVENT)
     print(f"  Request submitted (TX ID: {tx2_id})")
 
     print("\n[9] Bad Provider fulfills with BAD data (999°F, raining fire)...")
     bad_resp = {"city": "San Francisco", "temp_f": 999, "condition": "Raining fire", "humidity": -50}
-    send_tx(BAD_PROVIDER, contract.functions.fulfillTransaction(tx2_id, h(bad_resp)))
+    bad_resp_bytes = canon(bad_resp)
+    send_tx(BAD_PROVIDER, contract.functions.fulfillTransaction(tx2_id, h_bytes(bad_resp_bytes)))
     print("  Fulfilled with garbage data!")
 
     print("\n[10] Good Agent files dispute...")
-    evidence = h({"request": req_data2, "response": bad_resp, "complaint": "Data is clearly wrong"})
+    evidence = h_bytes(evidence_canon("Data is clearly wrong", req2_bytes, bad_resp_bytes))
     stake = usdc(0.001)
-    (judge_fee, tier) = contract.functions.getJudgeFee(GOOD_AGENT.address).call()
-    print(f"  Judge fee tier: {['district ($0.05)', 'appeals ($0.10)', 'supreme ($0.20)'][tier]} (fee: {judge_fee / 1e6} USDC)")
-    dispute_id = contract.functions.disputeCount().call()
-    send_tx(GOOD_AGENT, contract.functions.fileDispute(tx2_id, stake, evidence))
+    judge_fee, tier = contract.functions.getJudgeFee(GOOD_AGENT.address).call()
+    tier_name = ["district ($0.05)", "appeals ($0.10)", "supreme ($0.20)"][tier]
+    print(f"  Judge fee tier: {tier_name} (fee: {fmt_usdc(judge_fee)} USDC)")
+    receipt = send_tx(GOOD_AGENT, contract.functions.fileDispute(tx2_id, stake, evidence))
+    dispute_id = created_id(receipt, "DisputeFiled(uint256,uint256,address,uint256)")
     print(f"  Dispute filed! (ID: {dispute_id})")
 
     print("\n[11] Bad Provider responds with evidence...")
@@ -243,44 +511,27 @@ def main():
     print("  Submitting arguments to judge server...")
 
     try:
-        # Submit plaintiff argument
-        httpx.post(f"{JUDGE_SERVER}/dispute/argue", json={
-            "dispute_id": dispute_id,
-            "argument": (
+        resp = asyncio.run(submit_to_judge(
+            dispute_id,
+            plaintiff_arg=(
                 "I requested weather data for San Francisco. The provider returned: "
                 "temperature 999°F, condition 'Raining fire', humidity -50%. "
                 "This is clearly fabricated. San Francisco has never recorded anything "
                 "close to 999°F. The SLA requires 'accurate data'."
             ),
-        }, timeout=10)
-
-        # Submit defendant argument
-        httpx.post(f"{JUDGE_SERVER}/dispute/respond", json={
-            "dispute_id": dispute_id,
-            "argument": (
+            defendant_arg=(
                 "Our sensors showed 999°F at the time of the request. We delivered "
                 "the data our system produced. The SLA says 'accurate data' which "
                 "means data from our sensors."
             ),
-        }, timeout=10)
-
-        # Submit transaction data
-        httpx.post(f"{JUDGE_SERVER}/dispute/data", json={
-            "dispute_id": dispute_id,
-            "data": {
+            tx_data={
                 "service": "weather", "sla": "accurate data", "price": "0.05 USDC",
                 "request": req_data2, "response": bad_resp,
             },
-        }, timeout=10)
-
-        # Trigger AI judge ruling
-        print("  Calling AI judge...")
-        resp = httpx.post(f"{JUDGE_SERVER}/rule", json={
-            "dispute_id": dispute_id,
-        }, timeout=120)
+        ))
 
         if resp.status_code == 200:
-            ruling = resp.json()
+            ruling = json.loads(resp.content)
             print(f"\n  RULING: {ruling['winner'].upper()} wins!")
             print(f"  Court: {ruling.get('tier_name', '?')} ({ruling.get('court', '?')})")
             print(f"  Final: {ruling.get('final', False)}")
@@ -300,41 +551,53 @@ def main():
         print("  RULING: Good Agent wins! (direct)")
 
     # Final balances
-    print("\n" + "=" * 60)
+    print("\n" + RULE)
     print("FINAL STATE")
-    print("=" * 60)
-
-    for name, addr in [("Good Agent", GOOD_AGENT.address), ("Bad Provider", BAD_PROVIDER.address), ("Judge", judge_acct.address)]:
-        bal = contract.functions.balances(addr).call()
-        stats = contract.functions.getStats(addr).call()
-        ext_usdc = usdc_token.functions.balanceOf(addr).call()
+    print(RULE)
+
+    parties = [
+        ("Good Agent", GOOD_AGENT.address),
+        ("Bad Provider", BAD_PROVIDER.address),
+        ("Judge", judge_acct.address),
+    ]
+    *final_state, (fee, tier) = batch_read([
+        *[call for _, addr in parties for call in (
+            balances_of(addr),
+            contract.functions.getStats(addr),
+            usdc_token.functions.balanceOf(addr),
+        )],
+        contract.functions.getJudgeFee(BAD_PROVIDER.address),
+    ])
+    for i, (name, addr) in enumerate(parties):
+        bal, stats, ext_usdc = final_state[3 * i:3 * i + 3]
         print(f"\n  {name} ({addr[:10]}...)")
-        print(f"    Court balance:  {bal / 1e6} USDC")
-        print(f"    Wallet USDC:    {ext_usdc / 1e6} USDC")
+        print(f"    Court balance:  {fmt_usdc(bal)} USDC")
+        print(f"    Wallet USDC:    {fmt_usdc(ext_usdc)} USDC")
         print(f"    Transactions:   {stats[0]} total, {stats[1]} successful")
         print(f"    Disputes:       {stats[2]} won, {stats[3]} lost")
-        print(f"    Earned:         {stats[4] / 1e6} USDC")
-        print(f"    Spent:          {stats[5] / 1e6} USDC")
+        print(f"    Earned:         {fmt_usdc(stats[4])} USDC")
+        print(f"    Spent:          {fmt_usdc(stats[5])} USDC")
 
     # Tier escalation
-    (fee, tier) = contract.functions.getJudgeFee(BAD_PROVIDER.address).call()
     print(f"\n  Bad Provider next dispute tier: {['district ($0.05)', 'appeals ($0.10)', 'supreme ($0.20)'][tier]}")
 
     # Test withdraw
     print("\n[13] Testing withdraw...")
-    judge_court_bal = contract.functions.balances(judge_acct.address).call()
+    judge_court_bal, judge_usdc_before = batch_read([
+        balances_of(judge_acct.address),
+        usdc_token.functions.balanceOf(judge_acct.address),
+    ])
     if judge_court_bal > 0:
-        judge_usdc_before = usdc_token.functions.balanceOf(judge_acct.address).call()
         send_tx(judge_acct, contract.functions.withdraw(judge_court_bal))
         judge_usdc_after = usdc_token.functions.balanceOf(judge_acct.address).call()
-        print(f"  Judge withdrew {judge_court_bal / 1e6} USDC from court")
-        print(f"  USDC wallet: {judge_usdc_before / 1e6} → {judge_usdc_after / 1e6}")
+        print(f"  Judge withdrew {fmt_usdc(judge_court_bal)} USDC from court")
+        print(f"  USDC wallet: {fmt_usdc(judge_usdc_before)} → {fmt_usdc(judge_usdc_after)}")
     else:
         print("  Judge has no court balance to withdraw")
 
-    print("\n" + "=" * 60)
+    print("\n" + RULE)
     print("DEMO COMPLETE")
-    print("=" * 60)
+    print(RULE)
 
 
 if __name__ == "__main__":
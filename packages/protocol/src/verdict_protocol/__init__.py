@@ -9,7 +9,7 @@ from .hashing import (
     merkle_root_hash,
 )
 from .ipfs import EvidenceBundleStore, StoredBundle
-from .receipt_chain import ReceiptChainResult, verify_receipt_chain
+from .receipt_chain import ReceiptChainResult, verify_receipt_chain, verify_receipt_chain_append
 from .schema_validation import validate_schema
 from .signatures import (
     did_to_address,
@@ -42,5 +42,6 @@ __all__ = [
     "verify_signature_eip191",
     "did_to_address",
     "verify_receipt_chain",
+    "verify_receipt_chain_append",
     "validate_schema",
 ]
@@ -21,6 +21,11 @@ def _normalize(value: Any) -> Any:
     return value
 
 
+# _normalize already emits mappings in sorted key order, so the encoder does not re-sort;
+# a shared instance also skips building a new JSONEncoder on every call.
+_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+
 def canonical_json_obj(value: Any) -> Any:
     """Return a recursively normalized JSON-compatible object with stable key ordering."""
     return _normalize(value)
@@ -29,7 +34,7 @@ def canonical_json_obj(value: Any) -> Any:
 def canonical_json_dumps(value: Any) -> str:
     """Serialize JSON with sorted keys and no insignificant whitespace."""
     normalized = canonical_json_obj(value)
-    return json.dumps(normalized, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return _ENCODER.encode(normalized)
 
 
 def canonical_json_bytes(value: Any) -> bytes:
@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 import os
 import sqlite3
+import threading
 import time
 from dataclasses import dataclass
 from pathlib import Path
@@ -351,6 +352,9 @@ class EscrowClient:
         self.private_key = private_key
         self.account = self.w3.eth.account.from_key(private_key) if private_key else None
         self.dry_run = dry_run
+        # Callers may share one client across threads; nonces are read from the node, so
+        # transactions from this account are signed and mined one at a time.
+        self._send_lock = threading.Lock()
         self.deployment_mode = "legacy"
         self.vault_address: str | None = None
         self.registry_address: str | None = None
@@ -966,6 +970,10 @@ class EscrowClient:
         return payload
 
     def _send_tx(self, fn_call, *, value: int = 0) -> EscrowTxResult:
+        with self._send_lock:
+            return self._send_tx_locked(fn_call, value=value)
+
+    def _send_tx_locked(self, fn_call, *, value: int) -> EscrowTxResult:
         if self.dry_run:
             block = self._mock_next_counter("block", start=self._mock_block_start())
             return EscrowTxResult(tx_hash=self._mock_tx_hash("dry-run-tx"), status=1, block_number=block)
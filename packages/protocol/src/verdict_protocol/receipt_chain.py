@@ -13,6 +13,28 @@ class ReceiptChainResult:
     errors: list[str]
 
 
+def _link_errors(receipt: dict[str, Any], prev: dict[str, Any] | None) -> list[str]:
+    """Hash, prevHash and signature checks for one receipt against its predecessor."""
+    errors: list[str] = []
+    computed_hash = compute_receipt_hash(receipt)
+    if computed_hash != receipt.get("receiptHash"):
+        errors.append(f"receipt hash mismatch for {receipt.get('receiptId')}")
+
+    if prev is None:
+        if receipt.get("prevHash") != "0x0":
+            errors.append("first receipt prevHash must be 0x0")
+    elif receipt.get("prevHash") != prev.get("receiptHash"):
+        errors.append(f"prevHash mismatch for {receipt.get('receiptId')}")
+
+    try:
+        signer = did_to_address(receipt["actorId"])
+        if not verify_signature_eip191(receipt["receiptHash"], receipt["signature"], signer):
+            errors.append(f"signature mismatch for {receipt.get('receiptId')}")
+    except Exception as exc:  # pragma: no cover - defensive
+        errors.append(f"signature verification failed for {receipt.get('receiptId')}: {exc}")
+    return errors
+
+
 def verify_receipt_chain(
     receipts: list[dict[str, Any]],
     *,
@@ -38,23 +60,24 @@ def verify_receipt_chain(
         if expected_clause_hash and receipt.get("clauseHash") != expected_clause_hash:
             errors.append(f"receipt {receipt.get('receiptId')} has wrong clauseHash")
 
-        computed_hash = compute_receipt_hash(receipt)
-        if computed_hash != receipt.get("receiptHash"):
-            errors.append(f"receipt hash mismatch for {receipt.get('receiptId')}")
-
-        if idx == 0:
-            if receipt.get("prevHash") != "0x0":
-                errors.append("first receipt prevHash must be 0x0")
-        else:
-            prev = ordered[idx - 1]
-            if receipt.get("prevHash") != prev.get("receiptHash"):
-                errors.append(f"prevHash mismatch for {receipt.get('receiptId')}")
-
-        try:
-            signer = did_to_address(receipt["actorId"])
-            if not verify_signature_eip191(receipt["receiptHash"], receipt["signature"], signer):
-                errors.append(f"signature mismatch for {receipt.get('receiptId')}")
-        except Exception as exc:  # pragma: no cover - defensive
-            errors.append(f"signature verification failed for {receipt.get('receiptId')}: {exc}")
+        errors.extend(_link_errors(receipt, ordered[idx - 1] if idx else None))
 
     return ReceiptChainResult(ok=not errors, errors=errors)
+
+
+def verify_receipt_chain_append(
+    last: dict[str, Any] | None,
+    receipt: dict[str, Any],
+) -> ReceiptChainResult:
+    """Check that `receipt` extends a chain whose current tip is `last`.
+
+    Equivalent to `verify_receipt_chain(existing + [receipt])` when `existing` was itself
+    verified on ingest, but only hashes and verifies the new receipt.
+    """
+    errors: list[str] = []
+    expected_seq = 0 if last is None else int(last["sequence"]) + 1
+    seq = receipt["sequence"]
+    if seq != expected_seq:
+        errors.append(f"sequence mismatch at index={expected_seq}: got {seq}")
+    errors.extend(_link_errors(receipt, last))
+    return ReceiptChainResult(ok=not errors, errors=errors)
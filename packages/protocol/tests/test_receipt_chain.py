@@ -6,6 +6,7 @@ from verdict_protocol import (
     hash_canonical,
     sign_hash_eip191,
     verify_receipt_chain,
+    verify_receipt_chain_append,
 )
 
 
@@ -57,3 +58,26 @@ def test_receipt_chain_valid_and_tampered() -> None:
 
     result_bad = verify_receipt_chain([r0, tampered])
     assert not result_bad.ok
+
+
+def test_receipt_chain_append_checks_only_the_new_link() -> None:
+    a = Account.create()
+    b = Account.create()
+    a_did = f"did:8004:{a.address}"
+    b_did = f"did:8004:{b.address}"
+
+    r0 = _make_receipt(
+        seq=0, prev_hash="0x0", actor_key=a.key.hex(), actor_did=a_did, counterparty_did=b_did
+    )
+    r1 = _make_receipt(
+        seq=1,
+        prev_hash=r0["receiptHash"],
+        actor_key=b.key.hex(),
+        actor_did=b_did,
+        counterparty_did=a_did,
+    )
+
+    assert verify_receipt_chain_append(None, r0).ok
+    assert verify_receipt_chain_append(r0, r1).ok
+    assert not verify_receipt_chain_append(None, r1).ok
+    assert not verify_receipt_chain_append(r1, r1).ok